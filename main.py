@@ -18,6 +18,8 @@ from src.config.urls import init_routers
 from src.routes.teams_route import add_teams_route_fastapi
 from src.routes.test_route import add_test_route_fastapi
 from src.services.cronjob.models.source_handler.gcp_handler import GCS_EXECUTOR
+from src.services.rag_services.models.document_retriever import ensure_vector_store_indexes
+from src.services.rag_services.url_shortening_service import url_shortening_service
 
 # Check if the environment is set to production turn log level to WARNING
 env = os.environ.get("ENVIRONMENT", "development").lower()
@@ -43,8 +45,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:  # noqa: ARG001
     except Exception:
         logger.exception("Error initializing database")
 
+    if fastapi_settings.vector_store.create_document_name_index:
+        try:
+            await ensure_vector_store_indexes()
+        except Exception:
+            logger.exception("Error creating vector store indexes")
+
     yield  # This is where the application runs
     # Shutdown
+    url_shortening_service.flush_access_counts()
     GCS_EXECUTOR.shutdown()
     logger.info("FastAPI application shutdown")
 
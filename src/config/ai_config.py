@@ -20,6 +20,11 @@ class AzureOpenAIConfig:
         "AZURE_OPENAI_MODEL_DEPLOYMENT_NAME",
         "model-router",
     )
+    # Message classification is a short routing call that blocks the graph, so it can use a smaller, faster model
+    azure_openai_classifier_deployment_name = env.get_str(
+        "AZURE_OPENAI_CLASSIFIER_DEPLOYMENT_NAME",
+        azure_openai_model_deployment_name,
+    )
 
     # API versions
     chat_api_version = env.get_str("AZURE_CHAT_API_VERSION", "2025-01-01-preview")
@@ -13,6 +13,7 @@ from tempfile import _TemporaryFileWrapper
 
 from sqlalchemy import Engine, create_engine, func, text
 from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from src.config.environment import env
 
@@ -42,6 +43,10 @@ class DatabaseConfig:
     pool_timeout = 30
     pool_recycle = 1800
     pool_pre_ping = True
+    # Reuse the most recently returned connection so a small set stays warm
+    pool_use_lifo = True
+    # Behind PgBouncer in transaction mode the pooler owns the connections
+    use_null_pool = env.get_bool("DB_USE_NULL_POOL", False)
 
     @property
     def encoded_password(self) -> str:
@@ -109,12 +114,18 @@ class DatabaseConfig:
     @property
     def engine_options(self) -> dict:
         """Returns SQLAlchemy engine options."""
+        if self.use_null_pool:
+            return {
+                "poolclass": NullPool,
+                "pool_pre_ping": self.pool_pre_ping,
+            }
         return {
             "pool_size": self.pool_size,
             "max_overflow": self.max_overflow,
             "pool_timeout": self.pool_timeout,
             "pool_recycle": self.pool_recycle,
             "pool_pre_ping": self.pool_pre_ping,
+            "pool_use_lifo": self.pool_use_lifo,
         }
 
     def get_db_cert_on_gcp(self):
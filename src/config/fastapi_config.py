@@ -62,11 +62,30 @@ class AppSettings(BaseSettings):
         case_sensitive = False
 
 
+class VectorStoreSettings(BaseSettings):
+    """Vector store ingestion settings for FastAPI"""
+
+    embedding_batch_size: int = Field(default_factory=lambda: env.get_int("EMBEDDING_BATCH_SIZE", 50))
+    embedding_max_concurrency: int = Field(default_factory=lambda: env.get_int("EMBEDDING_MAX_CONCURRENCY", 4))
+    embedding_max_retries: int = Field(default_factory=lambda: env.get_int("EMBEDDING_MAX_RETRIES", 3))
+    embedding_retry_backoff_seconds: int = Field(
+        default_factory=lambda: env.get_int("EMBEDDING_RETRY_BACKOFF_SECONDS", 2),
+    )
+    create_document_name_index: bool = Field(
+        default_factory=lambda: env.get_bool("VECTOR_DB_CREATE_DOCUMENT_NAME_INDEX", False),
+    )
+
+    class Config:
+        env_prefix = ""
+        case_sensitive = False
+
+
 class Settings(BaseSettings):
     """Main settings class that includes all sub-settings"""
 
     db: DatabaseSettings = Field(default_factory=lambda: DatabaseSettings())
     app: AppSettings = Field(default_factory=lambda: AppSettings())
+    vector_store: VectorStoreSettings = Field(default_factory=lambda: VectorStoreSettings())
 
     # API Documentation settings (FastAPI has built-in support for OpenAPI)
     api_title: str = "IFD CPB API"
@@ -20,6 +20,7 @@ SQLALCHEMY_DATABASE_URI = fastapi_settings.db.database_url
 api_key = ai_config.azure.api_key
 azure_openai_endpoint = ai_config.azure.azure_openai_endpoint
 azure_chat_deployment_name = ai_config.azure.azure_openai_model_deployment_name
+azure_classifier_deployment_name = ai_config.azure.azure_openai_classifier_deployment_name
 azure_chat_api_version = ai_config.azure.chat_api_version
 azure_embedding_api_version = ai_config.azure.embedding_api_version
 azure_embedding_deployment_name = ai_config.azure.azure_embedding_model
@@ -1,6 +1,11 @@
 from langchain_openai import AzureOpenAIEmbeddings
 
-from src.config.settings import azure_embedding_deployment_name, azure_openai_endpoint, embedding_deployment
+from src.config.settings import (
+    azure_classifier_deployment_name,
+    azure_embedding_deployment_name,
+    azure_openai_endpoint,
+    embedding_deployment,
+)
 from src.services.custom_llm.services.llm_utils import LLMUtils
 
 AZURE_EMBEDDING = AzureOpenAIEmbeddings(
@@ -11,3 +16,4 @@ AZURE_EMBEDDING = AzureOpenAIEmbeddings(
 
 AZURE_LLM03 = LLMUtils.get_azure_openai_llm(temperature=0.3)
 AZURE_LLM00 = LLMUtils.get_azure_openai_llm(temperature=0)
+AZURE_CLASSIFIER_LLM = LLMUtils.get_azure_openai_llm(temperature=0, azure_deployment=azure_classifier_deployment_name)
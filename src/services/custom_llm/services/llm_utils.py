@@ -18,10 +18,11 @@ class LLMUtils:
         max_tokens: int | None = None,
         timeout: float | tuple[float, float] | None = None,
         max_retries: int | None = 2,
+        azure_deployment: str | None = None,
     ) -> AzureChatOpenAI:
-        """Get an instance of AzureChatOpenAI with specified parameters."""
+        """Get an instance of AzureChatOpenAI with specified parameters, on the chat deployment by default."""
         return AzureChatOpenAI(
-            azure_deployment=azure_chat_deployment_name,
+            azure_deployment=azure_deployment or azure_chat_deployment_name,
             api_version=azure_chat_api_version,
             api_key=SecretStr(api_key),
             azure_endpoint=azure_openai_endpoint,
@@ -5,13 +5,8 @@ from src.services.custom_llm.services.llm_utils import LLMUtils
 PROMPT_TEXT = "Based on this image, summarize this image."
 
 
-def summary_image_using_llm(image_base64: str, is_process_summary: bool) -> tuple[bool, str]:
-    """Summarize the image using LLM.
-
-    Check if the image is an icon or an actual image.
-    If it is an icon, return is_icon = true and summary of the icon.
-    If it is an actual image, return is_icon = false and summary of the image.
-    """
+def _build_summary_request(image_base64: str, is_process_summary: bool) -> tuple[bool, list[dict] | None]:
+    """Decide whether the image needs an LLM summary and build the request content for it."""
     # Check if the image is an icon (e.g., small size, specific patterns, etc.)
     is_icon = check_if_icon(image_base64)
 
@@ -21,18 +16,42 @@ def summary_image_using_llm(image_base64: str, is_process_summary: bool) -> tupl
         if is_process_summary:
             prompt_text = PROMPT_TEXT
         else:
-            return is_icon, ""
+            return is_icon, None
 
     request_content = [
         {"type": "text", "text": prompt_text},
         {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_base64}"}},
     ]
+    return is_icon, request_content
+
+
+def summary_image_using_llm(image_base64: str, is_process_summary: bool) -> tuple[bool, str]:
+    """Summarize the image using LLM.
+
+    Check if the image is an icon or an actual image.
+    If it is an icon, return is_icon = true and summary of the icon.
+    If it is an actual image, return is_icon = false and summary of the image.
+    """
+    is_icon, request_content = _build_summary_request(image_base64, is_process_summary)
+    if request_content is None:
+        return is_icon, ""
 
     llm_instance = LLMUtils.get_azure_openai_llm(timeout=30)
     response = llm_instance.invoke([HumanMessage(content=request_content)])
     return is_icon, str(response.content)
 
 
+async def asummary_image_using_llm(image_base64: str, is_process_summary: bool) -> tuple[bool, str]:
+    """Summarize the image using LLM asynchronously, so several images can be summarized concurrently."""
+    is_icon, request_content = _build_summary_request(image_base64, is_process_summary)
+    if request_content is None:
+        return is_icon, ""
+
+    llm_instance = LLMUtils.get_azure_openai_llm(timeout=30)
+    response = await llm_instance.ainvoke([HumanMessage(content=request_content)])
+    return is_icon, str(response.content)
+
+
 def check_if_icon(image_base64: str) -> bool:
     """
     Check if the image is an icon based on its characteristics.
@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import Optional
 
 import pandas as pd
@@ -31,6 +32,19 @@ from src.utils.gcp_helper import GCPHelper
 
 logger = logging.getLogger(__name__)
 
+_gcp_helper: GCPHelper | None = None
+_gcp_helper_lock = threading.Lock()
+
+
+def _get_gcp_helper() -> GCPHelper:
+    """Return the shared GCPHelper, creating it on first use."""
+    global _gcp_helper  # noqa: PLW0603
+    if _gcp_helper is None:
+        with _gcp_helper_lock:
+            if _gcp_helper is None:
+                _gcp_helper = GCPHelper()
+    return _gcp_helper
+
 
 class ManageSource:
     @classmethod
@@ -150,13 +164,14 @@ class ManageSource:
         # Refactored: Delete all GCP files for this collection
         cls._delete_gcp_files_for_collection(collection.id, db_to_use)
 
-        DocumentLog.delete_by_filter(db_session=db_to_use, collection_id=collection.id)
-        SyncLog.delete_by_filter(db_session=db_to_use, collection_id=collection.id)
-
         doc_retriever = DocumentRetriever.create_doc_retriever(
             collection_name=collection_name,
         )
         await doc_retriever.adelete_collection()
+
+        # Delete the logs and the collection with a single commit, without awaiting in between
+        DocumentLog.delete_by_filter(db_session=db_to_use, commit=False, collection_id=collection.id)
+        SyncLog.delete_by_filter(db_session=db_to_use, commit=False, collection_id=collection.id)
         Collection.delete_by_filter(id=collection.id, db_session=db_to_use)
 
     @classmethod
@@ -261,16 +276,15 @@ class ManageSource:
             gcp_path = doc.url_download
             if gcp_path and doc.source_type == SourceType.GCP:
                 try:
-                    GCPHelper().delete_file(gcp_path)
-                except Exception as e:
-                    logger.error(f"Error deleting file from GCP: {e}")
+                    _get_gcp_helper().delete_file(gcp_path)
+                except Exception:
+                    logger.exception("Error deleting file from GCP")
         # Remove document_log records corresponding to these pages (use batch delete)
         page_ids, not_found_page_ids = DocumentLog.get_existing_pages(collection.id, source_type, page_ids)
         if page_ids:
             collection_name = collection.name + "_" + collection.user_id if collection.user_id else collection.name
             doc_retriever = DocumentRetriever.create_doc_retriever(collection_name=collection_name)
-            for page_id in page_ids:
-                await doc_retriever.remove_documents(page_id)
+            await doc_retriever.remove_documents_batch(page_ids)
         DocumentLog.delete_pages(collection.id, page_ids)
         return not_found_page_ids
 
@@ -297,14 +311,15 @@ class ManageSource:
 
     @staticmethod
     def _delete_gcp_files_for_collection(collection_id, db_session):
-        docs = DocumentLog.find_by_filter(db_session=db_session, collection_id=collection_id)
+        docs = DocumentLog.iter_by_collection_id(collection_id, db_session=db_session)
         for doc in docs:
             gcp_path = doc.url_download
             if gcp_path:
                 try:
-                    GCPHelper().delete_file(gcp_path)
-                except Exception as e:
-                    print(f"Error deleting file from GCP: {e}")
+                    _get_gcp_helper().delete_file(gcp_path)
+                except Exception:
+                    logger.exception("Error deleting file from GCP")
+
     @staticmethod
     async def sync_rag_source(collection_id: str) -> ServiceResult:
         result = ServiceResult()
@@ -1,32 +1,48 @@
-from typing import List, Dict, Any
+import asyncio
+import itertools
+import logging
+from collections.abc import Callable
+from typing import Any, Dict, List
+
+from src.config.database_config import db
 from src.services.manage_rag_sources.services.manage_source import ManageSource
 
+logger = logging.getLogger(__name__)
+
+
+def _fetch_source_projection(fetch_sources: Callable[..., list], **kwargs: Any) -> list[dict]:
+    """Run a source query on a dedicated session and project rows to id/name dicts.
+
+    Each call opens its own session so that several projections can run in worker threads at once.
+    """
+    session = db.create_session()
+    try:
+        sources = fetch_sources(db=session, **kwargs)
+        if not isinstance(sources, list):
+            return []
+        return [{"id": source.id, "name": source.name} for source in sources]
+    finally:
+        session.close()
+
+
 async def get_available_sources(user_id = None) -> list:
     """Get all available RAG sources using direct service call.
-    
+
+    Common and user-specific sources are queried concurrently.
+
     Returns:
         list: A list of dictionaries, each containing 'id' and 'name' of a source.
     """
     try:
-        # Get common sources
-        common_sources = ManageSource.get_common_source_names()
-        sources_list = []
-        
-        # Process common sources
-        if common_sources and isinstance(common_sources, list):
-            for source in common_sources:
-                sources_list.append({"id": source.id, "name": source.name})
-        
-        # Get user-specific sources if user_id is provided
+        queries = [asyncio.to_thread(_fetch_source_projection, ManageSource.get_common_source_names)]
         if user_id:
-            user_sources = ManageSource.get_source_name_by_user_id(user_id=user_id)
-            if user_sources and isinstance(user_sources, list):
-                for source in user_sources:
-                    sources_list.append({"id": source.id, "name": source.name})
-        
-        return sources_list
-    except Exception as e:
-        print(f"Error fetching sources: {str(e)}")
+            queries.append(
+                asyncio.to_thread(_fetch_source_projection, ManageSource.get_source_name_by_user_id, user_id=user_id)
+            )
+        results = await asyncio.gather(*queries)
+        return list(itertools.chain.from_iterable(results))
+    except Exception:
+        logger.exception("Error fetching sources")
         return []
 
 async def get_source_by_id(source_id: str) -> Dict[str, Any]:
@@ -49,6 +65,6 @@ async def get_source_by_id(source_id: str) -> Dict[str, Any]:
                 
         # Return None if no matching source was found
         return None
-    except Exception as e:
-        print(f"Error getting source by ID: {str(e)}")
+    except Exception:
+        logger.exception("Error getting source by ID")
         return None
\ No newline at end of file
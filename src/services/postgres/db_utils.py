@@ -3,17 +3,37 @@ Database utilities for SQLAlchemy integration with FastAPI
 """
 
 from contextlib import contextmanager
-from typing import Generator, Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Generator
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-
-from src.config.database_config import get_db as config_get_db, db, Base
+from sqlalchemy import TextClause, text
+from sqlalchemy.orm import Session, sessionmaker
 
+from src.config.database_config import Base, db
+from src.config.database_config import get_db as config_get_db
 
 # Re-export the dependency to get DB session from config
 get_db = config_get_db
 
+# This works for PostgreSQL
+_TABLE_EXISTS_STMT = text("""
+    SELECT EXISTS (
+        SELECT FROM information_schema.tables
+        WHERE table_name = :table_name
+    );
+""")
+
+
+# Sessions handed out by get_db_context are closed on exit, so objects loaded in
+# them are never refreshed after commit; skipping the expiry avoids reload SELECTs
+_context_session_factory = sessionmaker(bind=db.engine, autoflush=False, expire_on_commit=False)
+
+
+@lru_cache(maxsize=256)
+def _cached_text(query: str) -> TextClause:
+    """Memoize text() construction so repeated raw queries reuse one statement object."""
+    return text(query)
+
 
 @contextmanager
 def get_db_context() -> Generator[Session, None, None]:
@@ -29,7 +49,7 @@ def get_db_context() -> Generator[Session, None, None]:
         result = session.query(MyModel).all()
     ```
     """
-    session = db.create_session()
+    session = _context_session_factory()
     try:
         yield session
         session.commit()
@@ -41,13 +61,17 @@ def get_db_context() -> Generator[Session, None, None]:
 
 
 def execute_raw_sql(
-    query: str, params: Dict[str, Any] = None, db_session: Session = None
+    query: str | TextClause, params: Dict[str, Any] = None, db_session: Session = None
 ) -> list:
     """
     Execute a raw SQL query with parameters
 
+    Callers running the same query repeatedly can pass a pre-built ``text()``
+    statement; plain strings are memoized so the statement (and its compiled
+    form in the engine cache) is reused across calls.
+
     Args:
-        query: Raw SQL query string
+        query: Raw SQL query string or pre-built text() statement
         params: Optional query parameters
         db_session: Optional SQLAlchemy session
 
@@ -55,11 +79,11 @@ def execute_raw_sql(
         List of result rows as dictionaries
     """
     session = db_session or db.session
-    result = session.execute(text(query), params or {})
+    statement = _cached_text(query) if isinstance(query, str) else query
+    result = session.execute(statement, params or {})
 
     # Convert results to dictionaries
-    keys = result.keys()
-    return [dict(zip(keys, row)) for row in result.fetchall()]
+    return [dict(row) for row in result.mappings()]
 
 
 def check_table_exists(table_name: str, db_session: Session = None) -> bool:
@@ -74,14 +98,5 @@ def check_table_exists(table_name: str, db_session: Session = None) -> bool:
         True if the table exists, False otherwise
     """
     session = db_session or db.session
-
-    # This works for PostgreSQL
-    query = text("""
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_name = :table_name
-        );
-    """)
-
-    result = session.execute(query, {"table_name": table_name})
+    result = session.execute(_TABLE_EXISTS_STMT, {"table_name": table_name})
     return result.scalar()
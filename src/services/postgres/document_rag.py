@@ -1,7 +1,16 @@
 import logging
 from datetime import datetime
 
-from src.services.postgres.models.tables.rag_sync_db.rag_doc_log_table import Collection, DocumentLog, SyncLog
+from sqlalchemy.dialects.postgresql import insert
+
+from src.config.database_config import db
+from src.config.settings import atlassian_confluence_url
+from src.services.postgres.models.tables.rag_sync_db.rag_doc_log_table import (
+    Collection,
+    DocumentLog,
+    SourceType,
+    SyncLog,
+)
 
 _logger = logging.getLogger("DocumentRag")
 
@@ -9,6 +18,9 @@ _logger = logging.getLogger("DocumentRag")
 class DocumentRag:
     """Class to manage document logging in PostgreSQL for RAG."""
 
+    UPSERT_CHUNK_SIZE = 1000
+    METADATA_KEYS = ("content_type", "document_size")
+
     def __init__(self, collection: Collection):
         """Initialize DocumentRag with a collection."""
         self.collection_id = collection.id
@@ -19,61 +31,65 @@ class DocumentRag:
         return SyncLog.create(collection_id=self.collection_id, notes=notes)
 
     def upsert_files(self, files, notes: str | None = None):
-        """Upsert files into document_log table."""
+        """Upsert files into document_log table.
+
+        Each file may carry ``source_type`` and ``source_path``; they default to the
+        Confluence source, matching the column server defaults.
+        """
         current_time = datetime.now()
 
         def metadata(file):
-            _metadata = {
-                "content_type": file.get("content_type"),
-                "document_size": file.get("document_size"),
-            }
-            # remove None values
-            _metadata = {k: v for k, v in _metadata.items() if v is not None}
-            return _metadata
+            # keep only the metadata keys that have a value
+            return {key: value for key in self.METADATA_KEYS if (value := file.get(key)) is not None}
 
-        # Get existing documents with the same identity_constant_name and collection_id
-        identity_names = [file["identity_constant_name"] for file in files]
-        existing_docs = DocumentLog.find_by_filter(
-            collection_id=self.collection_id,
-            identity_constant_name__in=identity_names,
-        )
-        # Create a dictionary of existing documents for fast lookup
-        existing_map = {(doc.identity_constant_name, doc.collection_id): doc for doc in existing_docs}
-        # Prepare data for insertion - only include new documents
-        new_docs = []
-        for file in files:
-            key = (file["identity_constant_name"], self.collection_id)
-            if key not in existing_map:
-                new_docs.append(
-                    {
-                        "identity_constant_name": file["identity_constant_name"],
-                        "display_name": file["display_name"],
-                        "content_hash": file["content_hash"],
-                        "collection_id": self.collection_id,
-                        "url_download": file.get("url_download"),
-                        "created_date": file.get("created_date", current_time),
-                        "updated_date": file.get("updated_date", current_time),
-                        "version": file.get("version"),
-                        "data_source_metadata": metadata(file),
-                    },
-                )
-        # Bulk insert only new documents
-        if new_docs:
-            document_log = DocumentLog()
-            document_log.bulk_insert(new_docs)
-        # Update existing documents individually
-        for file in files:
-            key = (file["identity_constant_name"], self.collection_id)
-            if key in existing_map:
-                doc = existing_map[key]
-                doc.display_name = file["display_name"]
-                doc.content_hash = file["content_hash"]
-                doc.url_download = file.get("url_download")
-                doc.updated_date = file.get("updated_date", current_time)
-                doc.version = file.get("version")
-                doc.data_source_metadata = metadata(file)
-                doc.save()
-        self.update_sync_time(notes)
+        def source_type(file: dict) -> SourceType:
+            return SourceType(file.get("source_type", SourceType.CONFLUENCE))
+
+        # Key by the conflict target: ON CONFLICT cannot touch the same row twice in one statement
+        rows_by_key = {
+            (file["identity_constant_name"], source_type(file)): {
+                "identity_constant_name": file["identity_constant_name"],
+                "display_name": file["display_name"],
+                "content_hash": file["content_hash"],
+                "collection_id": self.collection_id,
+                "source_type": source_type(file),
+                "source_path": file.get("source_path", atlassian_confluence_url),
+                "url_download": file.get("url_download"),
+                "created_date": file.get("created_date", current_time),
+                "updated_date": file.get("updated_date", current_time),
+                "version": file.get("version"),
+                "data_source_metadata": metadata(file),
+            }
+            for file in files
+        }
+        rows = list(rows_by_key.values())
+        # Insert new documents and update existing ones in one statement per chunk,
+        # relying on the unique_document_collection_source constraint
+        try:
+            # The Core upserts don't read pending ORM state; the commit flushes once at the end
+            with db.session.no_autoflush:
+                for i in range(0, len(rows), self.UPSERT_CHUNK_SIZE):
+                    stmt = insert(DocumentLog).values(rows[i : i + self.UPSERT_CHUNK_SIZE])
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=["identity_constant_name", "collection_id", "source_type"],
+                        set_={
+                            "display_name": stmt.excluded.display_name,
+                            "content_hash": stmt.excluded.content_hash,
+                            "url_download": stmt.excluded.url_download,
+                            "source_path": stmt.excluded.source_path,
+                            "updated_date": stmt.excluded.updated_date,
+                            "version": stmt.excluded.version,
+                            "data_source_metadata": stmt.excluded.data_source_metadata,
+                        },
+                    )
+                    db.session.execute(stmt)
+            # Record the sync in the same transaction so both writes share one commit
+            _logger.info("Updating sync time")
+            db.session.add(SyncLog(collection_id=self.collection_id, notes=notes))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
 
     def fetch_doc_logs(self):
         """Fetch all documents for the given collection_id."""
@@ -1,9 +1,10 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, select
 from sqlalchemy.dialects.postgresql import JSONB  # Import PostgreSQL specific types
 
-from src.config.database_config import Base
-from src.services.postgres.operation import DatabaseOperation
+from src.config.database_config import Base, db
+from src.services.postgres.operation import DatabaseOperation, transaction_handler
 
 
 class ChatHistory(Base, DatabaseOperation):
@@ -36,4 +37,20 @@ class ChatHistory(Base, DatabaseOperation):
     @classmethod
     def get_history_by_session(cls, session_id, limit=50, db_session=None):
         """Get chat history for a specific session, sorted by created_at descending"""
-        return cls.find_by_filter(session_id=session_id, db_session=db_session)[:limit]
+        session = db_session or db.session
+        return (
+            session.query(cls)
+            .filter_by(session_id=session_id)
+            .order_by(cls.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+
+    @classmethod
+    @transaction_handler
+    def get_recent_messages(cls, session_id: str, limit: int = 20, db_session=None) -> list[dict]:
+        """Get the stored message dicts of the latest `limit` messages of a session, oldest first"""
+        # ORDER BY id DESC LIMIT reads only the tail instead of the whole conversation
+        session = db_session or db.session
+        stmt = select(cls.message).where(cls.session_id == session_id).order_by(cls.id.desc()).limit(limit)
+        return session.scalars(stmt).all()[::-1]
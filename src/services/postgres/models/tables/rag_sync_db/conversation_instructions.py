@@ -2,15 +2,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional, Tuple
 
-from sqlalchemy import Column, func, Index, Integer, String, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, Index, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB, insert
 
 from src.config.database_config import Base, db
 from src.services.postgres.models.tables.rag_sync_db import TZDateTime
 from src.services.postgres.operation import DatabaseOperation
 
 
-@dataclass
+@dataclass(slots=True)
 class StoreItem:
 	"""
 	A data class representing a stored item in the database.
@@ -103,6 +103,25 @@ class ConversationInstructions(Base, DatabaseOperation):
 			)
 		return None
 
+	@classmethod
+	def get_value(cls, namespace: Tuple[str, ...], key: str, db_session=None) -> Optional[Dict[str, Any]]:
+		"""
+		Retrieve only the stored value for a namespace and key.
+
+		Selects the single `value` column, skipping ORM hydration and the `StoreItem` copy made by `get`.
+
+		Args:
+			namespace (Tuple[str, ...]): The namespace of the record as a tuple.
+			key (str): The unique key of the record.
+			db_session: Optional session to query with instead of the shared one, e.g. from a worker thread.
+
+		Returns:
+			Optional[Dict[str, Any]]: The stored value if the record exists, otherwise None.
+		"""
+		namespace_str = cls._serialize_namespace(namespace)
+		session = db_session or db.session
+		return session.query(cls.value).filter_by(namespace=namespace_str, key=key).scalar()
+
 	@classmethod
 	def put(cls: Any, namespace: Tuple[str, ...], key: str, value: Dict[str, Any]) -> None:
 		"""
@@ -118,16 +137,15 @@ class ConversationInstructions(Base, DatabaseOperation):
 		"""
 		namespace_str = cls._serialize_namespace(namespace)
 
-		# Check if the record already exists
-		existing = db.session.query(cls).filter_by(
-			namespace=namespace_str,
-			key=key
-		).first()
-
-		if existing:
-			existing.value = value
-		else:
-			record = cls(namespace=namespace_str, key=key, value=value)
-			db.session.add(record)
-
-		db.session.commit()
+		# Single atomic upsert on the (namespace, key) unique constraint
+		stmt = insert(cls).values(namespace=namespace_str, key=key, value=value)
+		stmt = stmt.on_conflict_do_update(
+			constraint='uq_namespace_instruction',
+			set_={'value': stmt.excluded.value, 'updated_at': func.now()}
+		)
+		try:
+			db.session.execute(stmt)
+			db.session.commit()
+		except Exception:
+			db.session.rollback()
+			raise
@@ -9,7 +9,9 @@ from sqlalchemy import (
     Integer,
     String,
     func,
+    inspect,
     select,
+    text,
     true,
 )
 from sqlalchemy.orm import Mapped, Session, mapped_column
@@ -35,7 +37,11 @@ class CronJobLog(Base, DatabaseOperation):
     start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
     end_time: Mapped[datetime] = mapped_column(DateTime, nullable=True)
 
-    __table_args__ = (Index("idx_updated_rag_sources", updated_rag_sources, postgresql_using="gin"),)
+    __table_args__ = (
+        Index("idx_updated_rag_sources", updated_rag_sources, postgresql_using="gin"),
+        # Partial index so get_latest_success_log is a backward scan over successful runs only
+        Index("idx_cronjob_success_latest", id, postgresql_where=text("is_success")),
+    )
 
     @classmethod
     def get_latest_log(cls, db_session: scoped_session[Session] | None = None) -> "CronJobLog | None":
@@ -59,11 +65,13 @@ class CronJobLog(Base, DatabaseOperation):
         end_time=None,
         db_session: Session | None = None,
     ) -> int:
-        """Create a new log."""
+        """Create a new log.
+
+        Callers are expected to pass collections with ``name`` and ``user_id`` loaded; any that
+        are expired are resolved together in one query instead of one lazy load each.
+        """
         new_log = cls.create(
-            updated_rag_sources=[
-                source.name if source.user_id is None else f"{source.name}_({source.user_id})" for source in sources
-            ],
+            updated_rag_sources=cls._source_display_names(sources, db_session),
             is_processing=is_processing,
             is_success=is_success,
             log=log,
@@ -72,6 +80,33 @@ class CronJobLog(Base, DatabaseOperation):
         )
         return new_log.id
 
+    @staticmethod
+    def _source_display_names(sources: list[Collection], db_session: Session | None = None) -> list[str]:
+        """Return the display names of the sources, batch loading any that are not hydrated."""
+        stale_ids = {
+            state.identity[0]
+            for state in map(inspect, sources)
+            if state.identity and state.unloaded & {"name", "user_id"}
+        }
+        fetched: dict[int, str] = {}
+        if stale_ids:
+            db_session = db_session or default_session
+            rows = (
+                db_session.query(Collection.id, Collection.name, Collection.user_id)
+                .filter(Collection.id.in_(stale_ids))
+                .all()
+            )
+            fetched = {row.id: Collection.format_display_name(row.name, row.user_id) for row in rows}
+
+        names = []
+        for source in sources:
+            identity = inspect(source).identity
+            if identity and identity[0] in fetched:
+                names.append(fetched[identity[0]])
+            else:
+                names.append(source.display_name)
+        return names
+
     @classmethod
     def update_log(
         cls,
@@ -129,14 +164,9 @@ class CronJobLog(Base, DatabaseOperation):
         """Get the minute range of the latest update."""
         db_session = db_session or default_session
 
-        # If collection_id is provided, get the collection to find its name
+        # If collection_id is provided, resolve its name server-side in the same query
         if collection_id:
-            collection = db_session.query(Collection).filter_by(id=collection_id).first()
-            if not collection:
-                _logger.error("Cant find this collection with id %s", collection_id)
-                return None
-
-            collection_name = collection.name
+            collection_name = select(Collection.name).where(Collection.id == collection_id).scalar_subquery()
 
         # Use the new style SQLAlchemy 2.0 select
         minutes_expr = func.ceil(func.extract("epoch", func.now() - cls.end_time) / 60).label("minutes")
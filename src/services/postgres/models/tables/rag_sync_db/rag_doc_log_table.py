@@ -1,4 +1,5 @@
 import enum
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Self
 
@@ -50,6 +51,16 @@ class Collection(Base, DatabaseOperation):
         {"extend_existing": True},
     )
 
+    @staticmethod
+    def format_display_name(name: str, user_id: str | None) -> str:
+        """Compose the name shown for a collection, suffixed with its owner for user collections."""
+        return name if user_id is None else f"{name}_({user_id})"
+
+    @property
+    def display_name(self) -> str:
+        """Display name of this collection, see ``format_display_name``."""
+        return self.format_display_name(self.name, self.user_id)
+
     def to_dict(self) -> dict:
         return {
             "name": self.name,
@@ -196,21 +207,40 @@ class DocumentLog(Base, DatabaseOperation):
             cls.data_source_metadata,
         ]
 
+    STREAM_BATCH_SIZE = 1000
+    DELETE_CHUNK_SIZE = 1000
+
     @classmethod
     def get_by_collection_id(
         cls, collection_id: int, db_session: scoped_session[Session] | None = None
     ) -> list["DocumentLog"]:
         return cls.find_by_filter(collection_id=collection_id, db_session=db_session)
 
+    @classmethod
+    def iter_by_collection_id(
+        cls, collection_id: int, db_session: Session | None = None
+    ) -> Iterator["DocumentLog"]:
+        """Iterate a collection's documents in batches instead of loading them all at once."""
+        db_session = db_session or db.session
+        return iter(db_session.query(cls).filter_by(collection_id=collection_id).yield_per(cls.STREAM_BATCH_SIZE))
+
     @classmethod
     def delete_by_names_and_collection_id(
         cls, names: list[str], collection_id: int, db_session: Session | None = None
     ) -> None:
         db_session = db_session or default_session
-        db_session.query(cls).filter(cls.identity_constant_name.in_(names), cls.collection_id == collection_id).delete(
-            synchronize_session=False
-        )
-        db_session.commit()
+        # Keep each IN list bounded; all chunks share one transaction and commit
+        try:
+            for i in range(0, len(names), cls.DELETE_CHUNK_SIZE):
+                chunk = names[i : i + cls.DELETE_CHUNK_SIZE]
+                db_session.query(cls).filter(
+                    cls.identity_constant_name.in_(chunk),
+                    cls.collection_id == collection_id,
+                ).delete(synchronize_session=False)
+            db_session.commit()
+        except Exception:
+            db_session.rollback()
+            raise
 
     @classmethod
     def get_by_collection_and_source(
@@ -249,10 +279,20 @@ class DocumentLog(Base, DatabaseOperation):
             A tuple containing (existing_page_ids, not_found_page_ids)
 
         """
-        results = cls.find_by_filter(collection_id=collection_id, source_type=source_type)
-        existing_page_ids = [row.identity_constant_name for row in results if row.identity_constant_name in page_ids]
-        not_found_page_ids = list(set(page_ids) - set(existing_page_ids))
-        return existing_page_ids, not_found_page_ids
+        if not page_ids:
+            return [], []
+        rows = (
+            db.session.query(cls.identity_constant_name)
+            .filter(
+                cls.collection_id == collection_id,
+                cls.source_type == source_type,
+                cls.identity_constant_name.in_(page_ids),
+            )
+            .all()
+        )
+        existing_page_ids = {row.identity_constant_name for row in rows}
+        not_found_page_ids = list(set(page_ids) - existing_page_ids)
+        return list(existing_page_ids), not_found_page_ids
 
     @classmethod
     def delete_pages(cls, collection_id: int, identity_constant_name: list[str]):
@@ -1,10 +1,16 @@
+import secrets
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Text, DateTime, UniqueConstraint, Index, func
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, UniqueConstraint, Index, bindparam, column, exists, func, select,
+    union_all, update, values
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql.expression import text
 
-from src.config.database_config import Base
-from src.services.postgres.operation import DatabaseOperation
+from src.config.database_config import Base, db
+from src.services.postgres.operation import DatabaseOperation, transaction_handler
 
 
 class URLShortening(Base, DatabaseOperation):
@@ -13,6 +19,11 @@ class URLShortening(Base, DatabaseOperation):
     """
     __tablename__ = 'url_shortening'
 
+    SHORT_CODE_LENGTH = 6
+    # Map the two non-alphanumeric URL-safe base64 characters so codes stay alphanumeric
+    _SHORT_CODE_TRANSLATION = str.maketrans('-_', 'AB')
+    MAX_SHORT_CODE_ATTEMPTS = 5
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     short_code = Column(String(8), nullable=False, unique=True)
     original_url = Column(Text, nullable=False)
@@ -24,59 +35,167 @@ class URLShortening(Base, DatabaseOperation):
     __table_args__ = (
         UniqueConstraint('short_code', name='uq_url_short_code'),
         UniqueConstraint('original_url', name='uq_url_original_url'),
-        Index('idx_url_short_code', 'short_code', unique=True),
+        # Covers original_url so the redirect lookup can be an index-only scan
+        Index('idx_url_short_code_cover', 'short_code', unique=True, postgresql_include=['original_url']),
         Index('idx_url_original_url', 'original_url'),
-        Index('idx_url_created_at', 'created_at'),
+        # created_at grows with insertion order, so a BRIN index stays tiny and cheap to maintain
+        Index(
+            'idx_url_created_at_brin', 'created_at',
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+        ),
         {'extend_existing': True}
     )
 
     @classmethod
+    @transaction_handler
     def get_by_short_code(cls, short_code: str, db_session=None) -> Optional['URLShortening']:
         """Get URL mapping by short code"""
-        results = cls.find_by_filter(short_code=short_code, db_session=db_session)
-        return results[0] if results else None
+        # Hot path for every redirect: reuse one prebuilt statement instead of find_by_filter
+        session = db_session or db.session
+        return session.scalars(_BY_SHORT_CODE_STMT, {'short_code': short_code}).first()
+
+    @classmethod
+    @transaction_handler
+    def get_original_url_by_short_code(cls, short_code: str, db_session=None) -> Optional[str]:
+        """Get only the original URL for a short code"""
+        session = db_session or db.session
+        return session.scalars(_ORIGINAL_URL_BY_SHORT_CODE_STMT, {'short_code': short_code}).first()
 
     @classmethod
     def get_by_original_url(cls, original_url: str, db_session=None) -> Optional['URLShortening']:
         """Get URL mapping by original URL"""
-        results = cls.find_by_filter(original_url=original_url, db_session=db_session)
+        results = cls.find_by_filter(original_url=original_url, _limit=1, db_session=db_session)
         return results[0] if results else None
 
     @classmethod
+    def generate_short_code(cls) -> str:
+        """Generate a random short code candidate from a single read of the system random source"""
+        token = secrets.token_urlsafe(cls.SHORT_CODE_LENGTH)[:cls.SHORT_CODE_LENGTH]
+        return token.translate(cls._SHORT_CODE_TRANSLATION)
+
+    @classmethod
+    @transaction_handler
     def create_or_get_mapping(cls, original_url: str, display_url: str, db_session=None) -> 'URLShortening':
-        """Create new mapping or return existing one"""
-        # Check if mapping already exists
-        existing = cls.get_by_original_url(original_url, db_session)
-        if existing:
-            return existing
-        
-        # Generate unique short code
-        import secrets
-        import string
-        alphabet = string.ascii_letters + string.digits
-        
-        short_code = None
-        max_attempts = 100
-        for _ in range(max_attempts):
-            candidate = ''.join(secrets.choice(alphabet) for _ in range(6))
-            if not cls.get_by_short_code(candidate, db_session):
-                short_code = candidate
+        """Create new mapping or return existing one
+
+        One statement reads the existing mapping and, only when there is none, inserts a new
+        one with a client-generated short code. Existing URLs are never rewritten, so repeat
+        calls stay read-only. A clash on the random short code, or a concurrent insert of the
+        same URL, is retried with a new candidate inside a savepoint.
+        """
+        session = db_session or db.session
+        table = cls.__table__
+        for _ in range(cls.MAX_SHORT_CODE_ATTEMPTS):
+            existing = select(table).where(table.c.original_url == original_url).cte('existing')
+            candidate = select(
+                bindparam('short_code', cls.generate_short_code(), String),
+                bindparam('original_url', original_url, Text),
+                bindparam('display_url', display_url, String)
+            ).where(~exists(existing.select()))
+            inserted = (
+                insert(table)
+                .from_select(['short_code', 'original_url', 'display_url'], candidate)
+                .on_conflict_do_nothing(index_elements=[table.c.original_url])
+                .returning(*table.c)
+                .cte('inserted')
+            )
+            stmt = select(cls).from_statement(union_all(select(inserted), select(existing)).limit(1))
+            try:
+                with session.begin_nested():
+                    mapping = session.scalars(stmt, execution_options={'populate_existing': True}).first()
+            except IntegrityError:
+                continue
+            if mapping is None:
+                # Lost a race with a concurrent insert of the same URL; the next attempt reads it
+                continue
+            session.commit()
+            return mapping
+
+        raise RuntimeError("Unable to generate unique short code")
+
+    @classmethod
+    @transaction_handler
+    def create_or_get_mappings(cls, display_urls: dict[str, str], db_session=None) -> dict[str, str]:
+        """Create or fetch the mappings of many URLs at once
+
+        Existing mappings are read with one SELECT ... IN and all missing ones are inserted with a
+        single multi-row INSERT. Rows skipped by ON CONFLICT, either a clashing random short code
+        or a concurrent insert of the same URL, are retried with new candidates.
+
+        Args:
+            display_urls: Mapping of original URL to its display URL
+
+        Returns:
+            Mapping of original URL to short code
+        """
+        session = db_session or db.session
+        table = cls.__table__
+        short_codes: dict[str, str] = {}
+        remaining = dict(display_urls)
+        for _ in range(cls.MAX_SHORT_CODE_ATTEMPTS):
+            if not remaining:
+                break
+            existing = session.execute(
+                select(table.c.original_url, table.c.short_code).where(table.c.original_url.in_(list(remaining)))
+            )
+            for original_url, short_code in existing:
+                short_codes[original_url] = short_code
+                del remaining[original_url]
+            if not remaining:
                 break
-        
-        if not short_code:
+            inserted = session.execute(
+                insert(table)
+                .values([
+                    {'short_code': cls.generate_short_code(), 'original_url': original_url, 'display_url': display_url}
+                    for original_url, display_url in remaining.items()
+                ])
+                .on_conflict_do_nothing()
+                .returning(table.c.original_url, table.c.short_code)
+            )
+            for original_url, short_code in inserted:
+                short_codes[original_url] = short_code
+                del remaining[original_url]
+
+        if remaining:
             raise RuntimeError("Unable to generate unique short code")
-        
-        # Create new mapping
-        new_mapping = cls(
-            short_code=short_code,
-            original_url=original_url,
-            display_url=display_url
+        session.commit()
+        return short_codes
+
+    @classmethod
+    @transaction_handler
+    def record_accesses(cls, accesses: dict[str, tuple[int, datetime]], db_session=None) -> None:
+        """
+        Apply buffered accesses in a single UPDATE ... FROM (VALUES ...) statement
+
+        Args:
+            accesses: Mapping of short code to (access count delta, last access time)
+        """
+        if not accesses:
+            return
+
+        session = db_session or db.session
+        pending = values(
+            column('short_code', String),
+            column('delta', Integer),
+            column('accessed_at', DateTime(timezone=True)),
+            name='pending',
+        ).data([(short_code, delta, accessed_at) for short_code, (delta, accessed_at) in accesses.items()])
+        session.execute(
+            update(cls)
+            .where(cls.short_code == pending.c.short_code)
+            .values(access_count=cls.access_count + pending.c.delta, last_accessed=pending.c.accessed_at)
+            .execution_options(synchronize_session=False)
         )
-        new_mapping.save(db_session=db_session)
-        return new_mapping
+        session.commit()
 
     def record_access(self, db_session=None):
         """Record access to this shortened URL"""
         self.last_accessed = datetime.now(timezone.utc)
         self.access_count += 1
         self.save(db_session=db_session)
+
+
+_BY_SHORT_CODE_STMT = select(URLShortening).where(URLShortening.short_code == bindparam('short_code')).limit(1)
+_ORIGINAL_URL_BY_SHORT_CODE_STMT = (
+    select(URLShortening.original_url).where(URLShortening.short_code == bindparam('short_code')).limit(1)
+)
@@ -1,12 +1,31 @@
 import functools
+import operator
+from collections.abc import Callable
 from typing import Any, Self, TypeVar
 
+from sqlalchemy import RowMapping, Select, delete, select
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from src.config.database_config import db
 
 T = TypeVar("T", bound="DatabaseOperation", covariant=True)
+Q = TypeVar("Q", Query, Select)
+
+# Django-style lookup suffix -> filter expression built from the model attribute and the value
+_LOOKUP_FILTERS: dict[str, Callable[[Any, Any], Any]] = {
+    "in": lambda field, value: field.in_(value),
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "contains": lambda field, value: field.contains(value),
+    "icontains": lambda field, value: field.ilike(f"%{value}%"),
+    "startswith": lambda field, value: field.startswith(value),
+    "endswith": lambda field, value: field.endswith(value),
+    "isnull": lambda field, value: field.is_(None) if value else field.isnot(None),
+    "exact": operator.eq,
+}
 
 
 def transaction_handler(func):
@@ -33,16 +52,25 @@ def transaction_handler(func):
     return wrapper
 
 
+def _commit_or_flush(session: Session, *, commit: bool) -> None:
+    """Commit the session, or only flush it so the caller can commit several writes together."""
+    if commit:
+        session.commit()
+    else:
+        session.flush()
+
+
 class DatabaseOperation:
     """Base class for database operations."""
 
     @classmethod
     @transaction_handler
-    def create(cls, db_session: Session | None = None, **kwargs) -> Self:
+    def create(cls, db_session: Session | None = None, *, commit: bool = True, **kwargs) -> Self:
         """Create a new instance in the database.
 
         Args:
             db_session: SQLAlchemy session to use
+            commit: Commit the transaction; pass False to only flush and commit later
             **kwargs: Fields to set on the model
 
         Returns:
@@ -52,7 +80,7 @@ class DatabaseOperation:
         session = db_session or db.session
         instance = cls(**kwargs)
         session.add(instance)
-        session.commit()
+        _commit_or_flush(session, commit=commit)
         return instance
 
     @classmethod
@@ -72,13 +100,41 @@ class DatabaseOperation:
         query = session.query(cls).filter_by(id=id).exists()
         return session.query(query).scalar()
 
+    @classmethod
+    def _apply_lookups(cls, query: Q, kwargs: dict[str, Any]) -> Q:
+        """Apply Django-style lookups (field__operator=value) and exact matches to a Query or Select."""
+        kwargs = dict(kwargs)
+
+        # Process kwargs to extract special lookups
+        for key, value in list(kwargs.items()):
+            if "__" in key:
+                field_name, lookup_type = key.split("__", 1)
+                kwargs.pop(key)  # Remove the special lookup from kwargs
+
+                # Get the model attribute for this field
+                field = getattr(cls, field_name, None)
+                if field is None:
+                    raise ValueError(f"Field '{field_name}' not found in model {cls.__name__}")
+
+                # Handle the lookup types
+                lookup_filter = _LOOKUP_FILTERS.get(lookup_type)
+                if lookup_filter is None:
+                    raise ValueError(f"Unsupported lookup type: {lookup_type}")
+                query = query.filter(lookup_filter(field, value))
+
+        # Apply remaining kwargs as exact matches
+        if kwargs:
+            query = query.filter_by(**kwargs)
+        return query
+
     @classmethod
     @transaction_handler
-    def find_by_filter(cls, db_session: Session | None = None, **kwargs) -> list[T]:
+    def find_by_filter(cls, db_session: Session | None = None, _limit: int | None = None, **kwargs) -> list[T]:
         """Find instances by filters using Django-style lookups.
 
         Args:
             db_session: SQLAlchemy session to use
+            _limit: Optional limit on the number of results; underscored so it cannot clash with a column filter
             **kwargs: Filter conditions with Django-style lookups (field__operator=value)
 
         Returns:
@@ -90,53 +146,41 @@ class DatabaseOperation:
             msg = "Session is required"
             raise ValueError(msg)
 
-        query = session.query(cls)
+        query = cls._apply_lookups(session.query(cls), kwargs)
+        if _limit is not None:
+            query = query.limit(_limit)
 
-        # Process kwargs to extract special lookups
-        for key, value in list(kwargs.items()):
-            if "__" in key:
-                field_name, lookup_type = key.split("__", 1)
-                kwargs.pop(key)  # Remove the special lookup from kwargs
+        return query.all()
 
-                # Get the model attribute for this field
-                field = getattr(cls, field_name, None)
-                if field is None:
-                    raise ValueError(f"Field '{field_name}' not found in model {cls.__name__}")
+    @classmethod
+    @transaction_handler
+    def find_by_filter_raw(
+        cls,
+        columns: list[str] | None = None,
+        db_session: Session | None = None,
+        _limit: int | None = None,
+        **kwargs,
+    ) -> list[RowMapping]:
+        """Find rows by filters like ``find_by_filter``, returning plain mappings instead of ORM instances.
 
-                # Handle the lookup types
-                if lookup_type == "in":
-                    query = query.filter(field.in_(value))
-                elif lookup_type == "gt":
-                    query = query.filter(field > value)
-                elif lookup_type == "lt":
-                    query = query.filter(field < value)
-                elif lookup_type == "gte":
-                    query = query.filter(field >= value)
-                elif lookup_type == "lte":
-                    query = query.filter(field <= value)
-                elif lookup_type == "contains":
-                    query = query.filter(field.contains(value))
-                elif lookup_type == "icontains":
-                    query = query.filter(field.ilike(f"%{value}%"))
-                elif lookup_type == "startswith":
-                    query = query.filter(field.startswith(value))
-                elif lookup_type == "endswith":
-                    query = query.filter(field.endswith(value))
-                elif lookup_type == "isnull":
-                    if value:
-                        query = query.filter(field.is_(None))
-                    else:
-                        query = query.filter(field.isnot(None))
-                elif lookup_type == "exact":
-                    query = query.filter(field == value)
-                else:
-                    raise ValueError(f"Unsupported lookup type: {lookup_type}")
+        For read-only paths: skips ORM hydration and identity map bookkeeping.
 
-        # Apply remaining kwargs as exact matches
-        if kwargs:
-            query = query.filter_by(**kwargs)
+        Args:
+            columns: Column names to select; defaults to all table columns
+            db_session: SQLAlchemy session to use
+            _limit: Optional limit on the number of results
+            **kwargs: Filter conditions with Django-style lookups (field__operator=value)
 
-        return query.all()
+        Returns:
+            List of row mappings keyed by column name
+
+        """
+        session = db_session or db.session
+        column_names = columns or cls.__table__.columns.keys()
+        stmt = cls._apply_lookups(select(*(getattr(cls, name) for name in column_names)), kwargs)
+        if _limit is not None:
+            stmt = stmt.limit(_limit)
+        return list(session.execute(stmt).mappings().all())
 
     @classmethod
     @transaction_handler
@@ -159,26 +203,44 @@ class DatabaseOperation:
 
     @classmethod
     @transaction_handler
-    def delete_by_filter(cls, db_session: Session | None = None, **kwargs) -> None:
-        """Delete instances matching filters.
+    def delete_by_filter(
+        cls, db_session: Session | None = None, *, commit: bool = True, returning_ids: bool = False, **kwargs,
+    ) -> list[Any] | None:
+        """Delete instances matching filters with a single bulk DELETE.
+
+        The session's identity map is not synchronized, so objects the caller still holds
+        for the deleted rows are stale; call ``session.expire_all()`` if they are reused.
 
         Args:
             db_session: SQLAlchemy session to use
+            commit: Commit the transaction; pass False to only flush and commit later
+            returning_ids: Return the primary keys of the deleted rows via DELETE ... RETURNING
             **kwargs: Filter conditions
 
+        Returns:
+            The deleted primary keys when returning_ids is set, otherwise None
+
         """
         session = db_session or db.session
-        session.query(cls).filter_by(**kwargs).delete()
-        session.commit()
+        stmt = delete(cls).filter_by(**kwargs).execution_options(synchronize_session=False)
+        if returning_ids:
+            stmt = stmt.returning(*cls.__table__.primary_key.columns)
+        result = session.execute(stmt)
+        deleted_ids = result.scalars().all() if returning_ids else None
+        _commit_or_flush(session, commit=commit)
+        return deleted_ids
 
     @classmethod
     @transaction_handler
-    def upsert(cls, keys: list[str], db_session: Session | None = None, **values) -> dict[str, Any]:
+    def upsert(
+        cls, keys: list[str], db_session: Session | None = None, *, commit: bool = True, **values
+    ) -> dict[str, Any]:
         """Upsert values into the database using PostgreSQL's INSERT ... ON CONFLICT.
 
         Args:
             keys: List of column names to use as the conflict target
             db_session: SQLAlchemy session to use
+            commit: Commit the transaction; pass False to only flush and commit later
             **values: Column values to insert/update
 
         Returns:
@@ -187,19 +249,67 @@ class DatabaseOperation:
         """
         session = db_session or db.session
 
-        stmt = insert(cls.__table__).values(**values)
-        update_values = {k: v for k, v in values.items() if k not in keys}
+        # Values are bound at execute time so the statement shape, and its compiled
+        # form, is the same for every call with the same columns
+        stmt = insert(cls.__table__)
+        update_columns = [k for k in values if k not in keys]
 
-        if update_values:
-            stmt = stmt.on_conflict_do_update(index_elements=keys, set_=update_values)
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=keys, set_={k: stmt.excluded[k] for k in update_columns},
+            )
         else:
             stmt = stmt.on_conflict_do_nothing(index_elements=keys)
 
-        session.execute(stmt)
-        session.commit()
+        session.execute(stmt, values)
+        _commit_or_flush(session, commit=commit)
 
         return values
 
+    @classmethod
+    @transaction_handler
+    def bulk_upsert(
+        cls,
+        rows: list[dict[str, Any]],
+        keys: list[str],
+        batch_size: int = 1000,
+        db_session: Session | None = None,
+        *,
+        commit: bool = True,
+    ) -> int:
+        """Upsert many rows with one multi-row INSERT ... ON CONFLICT statement per batch.
+
+        Args:
+            rows: Rows to upsert; every row must have the same columns
+            keys: List of column names to use as the conflict target
+            batch_size: Maximum number of rows per statement
+            db_session: SQLAlchemy session to use
+            commit: Commit the transaction; pass False to only flush and commit later
+
+        Returns:
+            Number of rows sent to the database
+
+        """
+        if not rows:
+            return 0
+
+        session = db_session or db.session
+        update_columns = [column for column in rows[0] if column not in keys]
+
+        for i in range(0, len(rows), batch_size):
+            stmt = insert(cls.__table__).values(rows[i : i + batch_size])
+            if update_columns:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=keys,
+                    set_={column: stmt.excluded[column] for column in update_columns},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=keys)
+            session.execute(stmt)
+        _commit_or_flush(session, commit=commit)
+
+        return len(rows)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert model to dictionary."""
         result = {}
@@ -214,38 +324,43 @@ class DatabaseOperation:
         return result
 
     @transaction_handler
-    def save(self, db_session: Session | None = None) -> None:
+    def save(self, db_session: Session | None = None, *, commit: bool = True) -> None:
         """Save this instance to the database.
 
         Args:
             db_session: SQLAlchemy session to use
+            commit: Commit the transaction; pass False to only flush and commit later
 
         """
         session = db_session or db.session
         session.add(self)
-        session.commit()
+        _commit_or_flush(session, commit=commit)
 
     @transaction_handler
-    def delete(self, db_session: Session | None = None) -> None:
+    def delete(self, db_session: Session | None = None, *, commit: bool = True) -> None:
         """Delete this instance from the database.
 
         Args:
             db_session: SQLAlchemy session to use
+            commit: Commit the transaction; pass False to only flush and commit later
 
         """
         session = db_session or db.session
         session.delete(self)
-        session.commit()
+        _commit_or_flush(session, commit=commit)
 
     @transaction_handler
-    def bulk_insert(self, data: list[dict[str, Any]], db_session: Session | None = None) -> None:
+    def bulk_insert(
+        self, data: list[dict[str, Any]], db_session: Session | None = None, *, commit: bool = True,
+    ) -> None:
         """Bulk insert data into the database.
 
         Args:
             data: List of dictionaries to insert
             db_session: SQLAlchemy session to use
+            commit: Commit the transaction; pass False to only flush and commit later
 
         """
         session = db_session or db.session
         session.bulk_insert_mappings(self.__class__, data)
-        session.commit()
+        _commit_or_flush(session, commit=commit)
@@ -4,6 +4,7 @@ URL Redirect Controller
 Handles redirects from short URLs to original URLs for RAG citations.
 """
 
+import asyncio
 import logging
 from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import RedirectResponse
@@ -14,6 +15,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/redirect", tags=["URL Shortening"])
 
+# A short code always points to the same URL, so clients and proxies may reuse the redirect
+REDIRECT_CACHE_CONTROL = "public, max-age=86400, immutable"
+URL_INFO_COLUMNS = ["short_code", "original_url", "display_url", "created_at", "last_accessed", "access_count"]
+
 
 @router.get("/{short_code}")
 async def redirect_short_url(short_code: str):
@@ -30,8 +35,8 @@ async def redirect_short_url(short_code: str):
         HTTPException: If short code is not found
     """
     try:
-        # Get original URL from database
-        original_url = url_shortening_service.get_original_url(short_code)
+        # Get original URL from cache or database, off the event loop
+        original_url = await asyncio.to_thread(url_shortening_service.get_original_url, short_code)
         
         if not original_url:
             logger.warning(f"Short code not found: {short_code}")
@@ -45,7 +50,8 @@ async def redirect_short_url(short_code: str):
         # Return redirect response
         return RedirectResponse(
             url=original_url,
-            status_code=302  # Temporary redirect
+            status_code=302,  # Temporary redirect
+            headers={"Cache-Control": REDIRECT_CACHE_CONTROL}
         )
         
     except HTTPException:
@@ -76,23 +82,21 @@ async def get_url_info(short_code: str):
     try:
         from src.services.postgres.models.tables.rag_sync_db.url_shortening_table import URLShortening
         
-        # Get URL mapping from database
-        url_mapping = URLShortening.get_by_short_code(short_code)
+        # Read only the reported columns as plain rows, no ORM instance is needed
+        rows = URLShortening.find_by_filter_raw(
+            columns=URL_INFO_COLUMNS,
+            short_code=short_code,
+            _limit=1
+        )
         
-        if not url_mapping:
+        if not rows:
             raise HTTPException(
                 status_code=404,
                 detail=f"Short URL '{short_code}' not found"
             )
         
-        return {
-            "short_code": url_mapping.short_code,
-            "original_url": url_mapping.original_url,
-            "display_url": url_mapping.display_url,
-            "created_at": url_mapping.created_at.isoformat(),
-            "last_accessed": url_mapping.last_accessed.isoformat() if url_mapping.last_accessed else None,
-            "access_count": url_mapping.access_count
-        }
+        # The row already has the response keys; FastAPI encodes the datetimes
+        return dict(rows[0])
         
     except HTTPException:
         # Re-raise HTTP exceptions
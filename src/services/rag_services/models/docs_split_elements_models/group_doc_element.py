@@ -1,17 +1,85 @@
+import itertools
 import logging
 import re
-from io import StringIO
 
+import lxml.html
 import pandas as pd
 from unstructured.documents.elements import Table, Title
 
 from src.constants.rag_company_constant import special_separators
-from src.services.custom_llm.services.proccess_images import summary_image_using_llm
+from src.services.custom_llm.services.proccess_images import asummary_image_using_llm, summary_image_using_llm
 from src.services.rag_services.models.doc_processor_element import DocProcessorElement
 from src.services.rag_services.models.docs_split_elements_models.doc_element_type import DocElementTypeEnum
 
 _logger = logging.getLogger(__name__)
 
+_SPECIAL_SEPARATORS_RE = re.compile("|".join(map(re.escape, special_separators)))
+_BASE64_RE = re.compile(r"<base64>(.*?)</base64>")
+
+
+def _new_titles(existing: list[str], candidates: list[str]) -> list[str]:
+    """Return the candidates not already in existing, in order and without repeats."""
+    seen = set(existing)
+    new_titles = []
+    for title in candidates:
+        if title not in seen:
+            seen.add(title)
+            new_titles.append(title)
+    return new_titles
+
+
+def _unique_header(header: list[str]) -> list[str]:
+    """Name blank header cells by position and suffix repeated names, as pandas.read_html does."""
+    counts: dict[str, int] = {}
+    columns = []
+    for index, cell in enumerate(header):
+        name = cell or f"Unnamed: {index}"
+        if name in counts:
+            counts[name] += 1
+            columns.append(f"{name}.{counts[name]}")
+        else:
+            counts[name] = 0
+            columns.append(name)
+    return columns
+
+
+def _parse_html_tables(html: str) -> list[pd.DataFrame]:
+    """Parse every <table> in an HTML fragment into a DataFrame, using the first row as the header.
+
+    Cells spanning several columns or rows are repeated into each slot they cover, and cell text is
+    whitespace-normalized. Values are kept as the strings shown in the document.
+    """
+    fragment = lxml.html.fragment_fromstring(html, create_parent="div")
+    tables = []
+    for table in fragment.iter("table"):
+        rows: list[list[str]] = []
+        # (row index, column index) -> text of a cell spanning into that slot from a row above
+        pending: dict[tuple[int, int], str] = {}
+        # Skip rows that belong to a table nested inside this one; it is parsed on its own
+        own_rows = (tr for tr in table.iter("tr") if next(tr.iterancestors("table")) is table)
+        for row_index, tr in enumerate(own_rows):
+            row: list[str] = []
+            for cell in tr.iterchildren("td", "th"):
+                while (row_index, len(row)) in pending:
+                    row.append(pending.pop((row_index, len(row))))
+                text = " ".join(cell.text_content().split())
+                colspan = int(cell.get("colspan", 1) or 1)
+                rowspan = int(cell.get("rowspan", 1) or 1)
+                for _ in range(colspan):
+                    for offset in range(1, rowspan):
+                        pending[(row_index + offset, len(row))] = text
+                    row.append(text)
+            while (row_index, len(row)) in pending:
+                row.append(pending.pop((row_index, len(row))))
+            rows.append(row)
+        if not rows:
+            continue
+        header, body = rows[0], rows[1:]
+        width = max(len(r) for r in rows)
+        header += [f"Unnamed: {i}" for i in range(len(header), width)]
+        tables.append(pd.DataFrame([r + [""] * (width - len(r)) for r in body], columns=_unique_header(header)))
+    return tables
+
 
 class GroupDocsElement:
     """GroupDocsElement is a class that represents a group of documents."""
@@ -21,6 +89,9 @@ class GroupDocsElement:
         self.titles = titles
         self.elements = elements
         self.item_type = item_type
+        self.__table_df: pd.DataFrame | None = None
+        self.__metadata: dict | None = None
+        self.__text: str | None = None
 
     @property
     def metadata(self):
@@ -35,6 +106,13 @@ class GroupDocsElement:
                                 filename of the first element, and other properties merged from the input metadata.
 
         """
+        # Titles, elements and input metadata are fixed after construction, so build the dict once.
+        # Callers get a copy because some of them rewrite metadata values in place.
+        if self.__metadata is None:
+            self.__metadata = self.__build_metadata()
+        return self.__metadata | {"titles": list(self.__metadata["titles"])}
+
+    def __build_metadata(self) -> dict:
         default_metadata = {
             "titles": [t.text for t in self.titles],
             "topic": self.elements[0].metadata.filename,
@@ -45,18 +123,12 @@ class GroupDocsElement:
                 default_metadata[key] = value
             else:
                 if key == "titles":
-                    new_titles = default_metadata[key]
-                    for title in value:
-                        if title not in default_metadata[key]:
-                            default_metadata[key].append(title)
-                    default_metadata[key] = new_titles
+                    default_metadata[key].extend(_new_titles(default_metadata[key], value))
                 else:
                     default_metadata[key] = value
 
         # remove special separators from titles
-        for i in range(len(default_metadata["titles"])):
-            for separator in special_separators:
-                default_metadata["titles"][i] = default_metadata["titles"][i].replace(separator, "")
+        default_metadata["titles"] = [_SPECIAL_SEPARATORS_RE.sub("", title) for title in default_metadata["titles"]]
         return default_metadata
 
     @property
@@ -97,42 +169,75 @@ class GroupDocsElement:
             case _:
                 return self.__export_for_texts(is_print)
 
+    async def aexport(
+        self,
+        image_collection: dict | None = None,
+        *,
+        is_print: bool = False,
+        export_table_as_df: bool = False,
+    ):
+        """Export like export, but summarize images without blocking the event loop."""
+        if self.item_type == DocElementTypeEnum.IMAGE and not is_print:
+            return await self.__aexport_for_images(image_collection)
+        return self.export(image_collection, is_print=is_print, export_table_as_df=export_table_as_df)
+
+    def __joined_text(self) -> str:
+        """Join the text of the titles and elements, built once since both export paths need it."""
+        if self.__text is None:
+            self.__text = "\n".join(e.text for e in itertools.chain(self.titles, self.elements) if e.text)
+        return self.__text
+
     def __export_for_images(self, image_collection: dict | None, is_print: bool = False) -> DocProcessorElement | str:
+        image = self.__find_image(image_collection)
+        if isinstance(image, DocProcessorElement):
+            return image
+        text_str, image_identifier, image_base_64 = image
+        if is_print:
+            return text_str
+
+        # Send image_base_64 to AI to summarize:
+        _, summary_image = summary_image_using_llm(image_base_64, True)
+        return self.__image_element(text_str, image_identifier, image_base_64, summary_image)
+
+    async def __aexport_for_images(self, image_collection: dict | None) -> DocProcessorElement:
+        image = self.__find_image(image_collection)
+        if isinstance(image, DocProcessorElement):
+            return image
+        text_str, image_identifier, image_base_64 = image
+
+        _, summary_image = await asummary_image_using_llm(image_base_64, True)
+        return self.__image_element(text_str, image_identifier, image_base_64, summary_image)
+
+    def __find_image(self, image_collection: dict | None) -> DocProcessorElement | tuple[str, str, str]:
+        """Locate the group's image, or return an empty element when it cannot be found."""
         if image_collection is None:
             _logger.error("image_collection is required")
             return DocProcessorElement(type=self.item_type.value, text="", metadata=self.metadata)
 
-        text_str = "\n".join([e.text for e in (self.titles + self.elements) if e.text])
-        match = re.search(r"<base64>(.*?)</base64>", text_str)
+        text_str = self.__joined_text()
+        # Only the first image placeholder in a group is summarized
+        match = _BASE64_RE.search(text_str)
         image_identifier = match.group(0) if match else None
 
         image_base_64 = image_collection.get(image_identifier)
         if image_base_64 is None:
             _logger.error("image_base_64 is not found in image_collection")
             return DocProcessorElement(type=self.item_type.value, text="", metadata=self.metadata)
+        return text_str, image_identifier, image_base_64
 
-        # Send image_base_64 to AI to summarize:
-        _, summary_image = summary_image_using_llm(image_base_64, True)
-
+    def __image_element(
+        self, text_str: str, image_identifier: str, image_base_64: str, summary_image: str,
+    ) -> DocProcessorElement:
         # Replace the matched string with the summary
-        if image_identifier:
-            summary_image_and_other_text = text_str.replace(image_identifier, summary_image)
-        else:
-            summary_image_and_other_text = text_str
-
-        return (
-            DocProcessorElement(
-                type=self.item_type.value,
-                text=summary_image_and_other_text,
-                base64=image_base_64,
-                metadata=self.metadata,
-            )
-            if not is_print
-            else text_str
+        return DocProcessorElement(
+            type=self.item_type.value,
+            text=text_str.replace(image_identifier, summary_image),
+            base64=image_base_64,
+            metadata=self.metadata,
         )
 
     def __export_for_texts(self, is_print=False):
-        text_str = "\n".join([e.text for e in (self.titles + self.elements) if e.text])
+        text_str = self.__joined_text()
 
         return (
             DocProcessorElement(type=self.item_type.value, text=text_str, metadata=self.metadata)
@@ -146,18 +251,21 @@ class GroupDocsElement:
 
         if is_print:
             return df_combined.to_markdown(index=False)
-        data = df_combined if export_table_as_df else df_combined.to_csv(index=False, sep=";")
+        # Fixed "\n" so the stored text does not depend on the platform line separator
+        data = df_combined if export_table_as_df else df_combined.to_csv(index=False, sep=";", lineterminator="\n")
 
         return DocProcessorElement(type=self.item_type.value, text=data, metadata=self.metadata)
 
     def __create_table_df(self) -> pd.DataFrame:
-        tables = []
-        for element in self.elements:
-            if isinstance(element, Table):
-                df = pd.read_html(StringIO(element.metadata.text_as_html), header=0)
-                tables.extend(df)
-        df_combined = pd.concat(tables, ignore_index=True)
-        return df_combined  # type: ignore
+        # shape and export both need the table, so parse the HTML only once
+        if self.__table_df is None:
+            tables = []
+            for element in self.elements:
+                if isinstance(element, Table):
+                    tables.extend(_parse_html_tables(element.metadata.text_as_html))
+            # Most groups hold a single table, which needs no concat copy
+            self.__table_df = tables[0] if len(tables) == 1 else pd.concat(tables, ignore_index=True)
+        return self.__table_df
 
     @staticmethod
     def combine(group1, group2):
@@ -182,16 +290,17 @@ class GroupDocsElement:
 
         for group in [group1, group2]:
             for element in [*group.titles, *group.elements]:
-                if isinstance(element, Title) and element.id not in processed_titles:
+                if isinstance(element, Title):
+                    # A heading shared by both groups is kept only once
+                    if element.id in processed_titles:
+                        continue
                     processed_titles.add(element.id)
-                    combined_elements.append(element)
-                else:
-                    combined_elements.append(element)
+                combined_elements.append(element)
 
         metadata1 = group1.metadata
         metadata2 = group2.metadata
         combined_metadata = {
-            "titles": metadata1["titles"] + [t for t in metadata2["titles"] if t not in metadata1["titles"]],
+            "titles": metadata1["titles"] + _new_titles(metadata1["titles"], metadata2["titles"]),
             "topic": metadata1["topic"],
         }
 
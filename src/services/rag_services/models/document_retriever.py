@@ -1,11 +1,12 @@
 import asyncio
+import itertools
 import logging
 import threading
+from collections.abc import Iterable, Iterator
 from typing import Self
 
+import openai
 from langchain_postgres.vectorstores import PGVector
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.sql.expression import text
 
@@ -18,8 +19,18 @@ from src.services.rag_services.models.doc_processor_element import DocProcessorE
 _logger = logging.getLogger("DocumentRetriever")
 
 
+DOCUMENT_NAME_INDEX_DDL = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pg_embedding_document_name "
+    "ON langchain_pg_embedding (collection_id, (cmetadata ->> 'document_name') text_pattern_ops)"
+)
+
+
 class DatabaseEngineManager:
-    """Thread-safe singleton manager for database engines using lazy initialization."""
+    """Thread-safe singleton manager for the async vector store engine using lazy initialization.
+
+    Only the async engine is managed: PGVector runs in async mode and document removal uses
+    async sessions, so no synchronous pool is ever opened for the vector database.
+    """
 
     _instance: Self | None = None
     _lock = threading.Lock()
@@ -38,28 +49,12 @@ class DatabaseEngineManager:
         if getattr(self, "_initialized", False):
             return
 
-        self._sync_engine = None
         self._async_engine = None
         self._async_session_maker = None
-        self._engine_lock = threading.Lock()
+        # Re-entrant: the session maker is built under the lock and may create the engine first
+        self._engine_lock = threading.RLock()
         self._initialized = True
 
-    def get_sync_engine(self) -> Engine:
-        """Get or create the synchronous database engine."""
-        if self._sync_engine is None:
-            with self._engine_lock:
-                if self._sync_engine is None:
-                    try:
-                        self._sync_engine = create_engine(
-                            fastapi_settings.db.vector_db_url,
-                            **fastapi_settings.db.engine_options,
-                        )
-                        _logger.info("Synchronous database engine created successfully")
-                    except Exception as e:
-                        _logger.error(f"Failed to create synchronous engine: {e}")
-                        raise
-        return self._sync_engine
-
     def get_async_engine(self) -> AsyncEngine:
         """Get or create the asynchronous database engine."""
         if self._async_engine is None:
@@ -102,14 +97,22 @@ class DatabaseEngineManager:
                         raise
         return self._async_session_maker
 
+    async def ensure_document_name_index(self) -> None:
+        """Create the expression index that serves document-name prefix lookups, if it is missing.
+
+        PGVector owns langchain_pg_embedding and creates no index on cmetadata ->> 'document_name', so
+        removing a document's chunks would otherwise scan the whole table. text_pattern_ops lets
+        LIKE 'prefix%' use the index under any collation. CONCURRENTLY avoids blocking ingestion but
+        cannot run inside a transaction, hence the autocommit connection.
+        """
+        async with self.get_async_engine().connect() as connection:
+            autocommit = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            await autocommit.execute(text(DOCUMENT_NAME_INDEX_DDL))
+        _logger.info("Vector store document name index is in place")
+
     def close_engines(self) -> None:
         """Close all database engines - useful for cleanup in tests or shutdown."""
         with self._engine_lock:
-            if self._sync_engine:
-                self._sync_engine.dispose()
-                self._sync_engine = None
-                _logger.info("Synchronous engine closed")
-
             if self._async_engine:
                 # For async engines, we need to handle cleanup differently
                 # This should be called from an async context
@@ -123,13 +126,30 @@ class DatabaseEngineManager:
 _db_manager = DatabaseEngineManager()
 
 
+async def ensure_vector_store_indexes() -> None:
+    """Create the supporting vector store indexes that PGVector does not manage."""
+    await _db_manager.ensure_document_name_index()
+
+
+def _batched(pairs: Iterable[tuple[str, dict]], size: int) -> Iterator[tuple[list[str], list[dict]]]:
+    """Lazily group (text, metadata) pairs into (texts, metadatas) batches of at most size items."""
+    pairs = iter(pairs)
+    while chunk := list(itertools.islice(pairs, size)):
+        texts, metadatas = zip(*chunk, strict=True)
+        yield list(texts), list(metadatas)
+
+
+def _retry_after_seconds(error: openai.RateLimitError) -> float | None:
+    """Read the provider's Retry-After header from a rate-limit error, if present."""
+    try:
+        return float(error.response.headers["retry-after"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
 class DocumentRetriever:
     """Class to retrieve and manage documents in a vector store."""
 
-    # Class constants
-    BATCH_SIZE = 50
-    BATCH_SLEEP_SECONDS = 3
-
     def __init__(
         self,
         endpoint: str,
@@ -168,18 +188,16 @@ class DocumentRetriever:
     @staticmethod
     def __parse_doc_metadata(topic_name: str | None, view_url: str | None, text, metadata, doc_type=None, base64=None):
         for key, value in metadata.items():
-            if isinstance(value, list):
-                metadata[key] = ", ".join(value)
-            else:
-                metadata[key] = str(value)
+            if type(value) is str:
+                continue
+            metadata[key] = ", ".join(value) if isinstance(value, list) else str(value)
         if base64:
             metadata["base64"] = base64
-        table_data = text if doc_type == "table" else None
-        return metadata | {
-            "topic": topic_name,
-            "view_url": view_url,
-            "table": table_data,
-        }
+        # The element's metadata dict is already a per-element copy, so fill it in place
+        metadata["topic"] = topic_name
+        metadata["view_url"] = view_url
+        metadata["table"] = text if doc_type == "table" else None
+        return metadata
 
     async def add_documents(
         self,
@@ -191,24 +209,21 @@ class DocumentRetriever:
     ):
         """Add documents to the vector store asynchronously"""
         try:
-            if not texts or not any(t.text.strip() for t in texts if hasattr(t, "text")):
+            # isspace() scans in place where strip() would copy every text
+            if not any((text := getattr(t, "text", None)) and not text.isspace() for t in texts):
                 return  # Skip if no valid content
 
+            # The topic prefix is the same for every table item in this call
+            topic_prefix = f"{topic_name}: " if topic_name else ""
+
             def update_table_content(item) -> str:
-                metadata = item.metadata
-                if doc_type != "table":
-                    return item.text
-                topic = topic_name
-                titles = metadata.get("titles")
-                content = item.text
-                if topic:
-                    content = f"{topic}: {content}"
+                titles = item.metadata.get("titles")
+                content = f"{topic_prefix}{item.text}"
                 if titles:
-                    titles_str = ", ".join(titles)
-                    content = f"{titles_str}: {content}"
+                    content = f"{', '.join(titles)}: {content}"
                 return content
 
-            doc_texts = list(map(update_table_content, texts))
+            doc_texts = list(map(update_table_content, texts)) if doc_type == "table" else [t.text for t in texts]
             metadata = [
                 {"document_name": document_name, "type": doc_type}
                 | self.__parse_doc_metadata(
@@ -222,21 +237,49 @@ class DocumentRetriever:
                 for t in texts
             ]
             if doc_texts:
+                settings = fastapi_settings.vector_store
+                batches = _batched(zip(doc_texts, metadata, strict=True), settings.embedding_batch_size)
+                _logger.info(f"\tAdding {len(doc_texts)} documents")
+                # A fixed pool of workers pulls batches lazily, so only in-flight batches are materialized
+                workers = [
+                    asyncio.create_task(self._add_batches(batches))
+                    for _ in range(settings.embedding_max_concurrency)
+                ]
                 try:
-                    total_docs = len(doc_texts)
-                    for i in range(0, total_docs, self.BATCH_SIZE):
-                        _logger.info(f"\tAdding documents {i} to {i + self.BATCH_SIZE} / {total_docs}")
-                        batch_texts = doc_texts[i : i + self.BATCH_SIZE]
-                        batch_metadata = metadata[i : i + self.BATCH_SIZE]
-                        await self.vector_store.aadd_texts(texts=batch_texts, metadatas=list(batch_metadata))
-                        await asyncio.sleep(self.BATCH_SLEEP_SECONDS)
+                    await asyncio.gather(*workers)
                 except Exception:
+                    for worker in workers:
+                        worker.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
                     await self.remove_documents(document_name)
                     raise
         except Exception:
             _logger.exception(f"Add documents failed for {document_name}")
             raise
 
+    async def _add_batches(self, batches: Iterator[tuple[list[str], list[dict]]]) -> None:
+        """Worker that embeds and stores batches until the shared iterator is exhausted."""
+        for batch_texts, batch_metadata in batches:
+            await self._add_batch(batch_texts, batch_metadata)
+
+    async def _add_batch(self, batch_texts: list[str], batch_metadata: list[dict]) -> None:
+        """Embed and store one batch, backing off only when the embedding provider rate-limits us."""
+        settings = fastapi_settings.vector_store
+        delay = settings.embedding_retry_backoff_seconds
+        for attempt in range(settings.embedding_max_retries + 1):
+            try:
+                await self.vector_store.aadd_texts(texts=batch_texts, metadatas=batch_metadata)
+                return
+            except openai.RateLimitError as e:
+                if attempt == settings.embedding_max_retries:
+                    raise
+                retry_after = _retry_after_seconds(e)
+                if retry_after is None:
+                    retry_after = delay
+                _logger.warning(f"Embedding rate limited, retrying batch in {retry_after}s")
+                await asyncio.sleep(retry_after)
+                delay *= 2
+
     async def update_documents(
         self,
         texts: list[DocProcessorElement],
@@ -253,35 +296,32 @@ class DocumentRetriever:
 
     async def remove_documents(self, doc_id_prefix: str) -> bool:
         """Remove documents from the vector store by prefix asynchronously."""
+        return await self.remove_documents_batch([doc_id_prefix])
+
+    async def remove_documents_batch(self, doc_id_prefixes: list[str]) -> bool:
+        """Remove documents matching any of the given prefixes in a single round-trip."""
+        if not doc_id_prefixes:
+            return False
         try:
-            # Use async session
-            _logger.info(f"Removing documents with prefix: {doc_id_prefix}")
+            _logger.info(f"Removing documents with prefixes: {doc_id_prefixes}")
             async with self.async_session_maker() as session:
-                collection_id_query = await session.execute(
-                    text("SELECT uuid FROM langchain_pg_collection WHERE name = :collection_name"),
-                    {"collection_name": self.collection_name},
-                )
-                collection_id = collection_id_query.scalar_one()
-
-                ids_query = await session.execute(
+                # PGVector keeps no state beyond these rows, so one DELETE replaces SELECT ids + adelete.
+                # One LIKE per prefix (not LIKE ANY) so each can use idx_pg_embedding_document_name;
+                # only the generated parameter names are interpolated into the SQL.
+                patterns = {f"doc_id_pattern_{i}": f"{prefix}%" for i, prefix in enumerate(doc_id_prefixes)}
+                name_filter = " OR ".join(f"e.cmetadata ->> 'document_name' LIKE :{name}" for name in patterns)
+                result = await session.execute(
                     text(
-                        "SELECT id FROM langchain_pg_embedding "
-                        "WHERE collection_id = :collection_id "
-                        "AND cmetadata ->>'document_name' LIKE :doc_id_pattern",
+                        "DELETE FROM langchain_pg_embedding AS e "  # noqa: S608
+                        "USING langchain_pg_collection AS c "
+                        f"WHERE e.collection_id = c.uuid AND c.name = :collection_name AND ({name_filter})",
                     ),
-                    {
-                        "collection_id": collection_id,
-                        "doc_id_pattern": f"{doc_id_prefix}%",
-                    },
+                    {"collection_name": self.collection_name, **patterns},
                 )
-                ids_to_delete = list(ids_query.scalars().all())
-
-                if ids_to_delete:
-                    await self.vector_store.adelete(ids=ids_to_delete)
-                    return True
-                return False
+                await session.commit()
+                return result.rowcount > 0
         except Exception:
-            _logger.exception(f"Remove failed for prefix {doc_id_prefix}")
+            _logger.exception(f"Remove failed for prefixes {doc_id_prefixes}")
             return False
 
     async def adelete_collection(self) -> None:
@@ -1,5 +1,4 @@
 import logging
-import traceback
 
 import yaml
 from langchain_core.messages import AIMessage, HumanMessage
@@ -30,6 +29,9 @@ from src.services.rag_services.models.graph_builder.state import GraphState
 
 logger = logging.getLogger(__name__)
 
+# Query rewriting and instruction updates only look at the latest turns of the fetched history
+RECENT_HISTORY_SIZE = 10
+
 
 class GraphBuilder:
     def __init__(
@@ -47,29 +49,16 @@ class GraphBuilder:
         if state["classification_message"] in ("feedback", "greeting"):
             return {}
 
-        human_message = self._get_latest_human_message(state["messages"])
-        histories = state.get("history", [])[-10:]
         response = await create_queries(
-            human_message=human_message,
-            histories=histories,
+            human_message=state["question"],
+            histories=state.get("recent_history", []),
         )
 
         return {"gen_queries": response}
 
     @staticmethod
     def _should_analysis_tables(state):
-        try:
-            tables = state.get("tables", [])
-            can_analyze = state.get("analyze_table", False)
-            if not tables or not can_analyze:
-                return "generate"
-            return "analysis_tables"
-        except Exception as e:
-            logger.error(
-                f"Error in _should_analysis_tables: {e}. Traceback: {traceback.format_exc()}",
-            )
-
-        return "generate"
+        return "analysis_tables" if state.get("tables") and state.get("analyze_table", False) else "generate"
 
     @staticmethod
     async def _generate(state: GraphState, writer: StreamWriter):
@@ -97,7 +86,7 @@ class GraphBuilder:
         can_analyze = state.get("analyze_table", False)
         human_message = state["question"]
 
-        return analysis_table(can_analyze, human_message, tables)
+        return await analysis_table(can_analyze, human_message, tables)
 
     @staticmethod
     def _get_latest_human_message(state_messages) -> str:
@@ -118,38 +107,41 @@ class GraphBuilder:
             return None
 
         writer({"save_instructions": "Updating memory..."})
-        histories = state.get("history", [])[-10:]
-        response = save_instruction_prompts(
+        response = await save_instruction_prompts(
             conversation_id=conversation_id,
             user_message=state["question"],
-            histories=histories,
+            histories=state.get("recent_history", []),
         )
+        # Dump the model once; the same dict feeds both the node message and the debug output
+        updates = response.model_dump()
         node_message = "I have update my memory with your feedback. This is what i updated:\n"
-        update_process = yaml.dump(response.model_dump())
+        update_process = yaml.safe_dump(updates)
         node_message += update_process
         writer({"save_instructions": "Updating memory: Done!"})
 
         return {
-            "debug": response.model_dump() if response else None,
+            "debug": updates,
             "node_message": {"save_instructions": node_message},
         }
 
     async def classify_message(self, state: GraphState):
         """Classify the user message into a specific category."""
-        human_message = self._get_latest_human_message(state["messages"])
-
         if state.get("using_memory", True):
-            response = await classify_message_node(human_message)
+            response = await classify_message_node(state["question"])
             return {"classification_message": response}
 
         return {"classification_message": "message"}
 
     async def fetch_conversation_data(self, state: GraphState):
-        """Fetch conversation data from the database. Include: chat_histories and persona instruction."""
+        """Fetch conversation data from the database. Include: chat_histories and persona instruction.
+
+        The latest human message and the recent tail of the history are resolved here once, so the
+        nodes after it read them from the state instead of rescanning the messages.
+        """
         conversation_id = state.get("chat_state", {}).get("conversation_id")
         human_message = self._get_latest_human_message(state["messages"])
         if not conversation_id:
-            return {"history": [], "instructions": [], "question": human_message}
+            return {"history": [], "recent_history": [], "instructions": [], "question": human_message}
         if state.get("using_memory", True):
             last_20_messages, prompts = await fetch_conversation_data(
                 conversation_id=conversation_id,
@@ -160,6 +152,7 @@ class GraphBuilder:
 
         return {
             "history": last_20_messages,
+            "recent_history": last_20_messages[-RECENT_HISTORY_SIZE:],
             "instructions": prompts,
             "question": human_message,
         }
@@ -7,7 +7,3 @@ class ClassifyMessage(BaseModel):
 		...,
 		description="Category of the message"
 	)
-	reason: str = Field(
-		...,
-		description="Reason why this instruction set is suitable for the update request"
-	)
@@ -1,12 +1,15 @@
+import asyncio
 import json
-from concurrent.futures import ThreadPoolExecutor
+import logging
 
 from langchain_core.messages import SystemMessage
 
 from src.services.custom_llm.controllers.table_analysis_controller import TableAnalysisController
 
+logger = logging.getLogger(__name__)
 
-def analysis_table(can_analyze, human_message, dfs):
+
+async def analysis_table(can_analyze, human_message, dfs):
 	"""
 	Analyzes a list of dataframes and generates Python code for each table.
 
@@ -24,27 +27,28 @@ def analysis_table(can_analyze, human_message, dfs):
 		return node_response
 
 	try:
-		if not dfs:
-			return node_response
-
-		# Generate Python code for each table
-		with ThreadPoolExecutor() as executor:
-			responses = executor.map(
-				lambda df: TableAnalysisController.post(df, human_message), dfs
-			)
+		# Generate Python code for each table; the controller is sync (LLM call + exec),
+		# so run each on the loop's shared default executor instead of a pool per call
+		responses = await asyncio.gather(
+			*(asyncio.to_thread(TableAnalysisController.post, df, human_message) for df in dfs),
+			return_exceptions=True,
+		)
 
 		# Collect analysis results
-		analysis_results = [
-			{
-				'result': response.get('result'),
-				'code': response.get('python_code'),
-			}
-			for idx, (response, df) in enumerate(zip(responses, dfs)) if response
-		]
+		analysis_results = []
+		for response in responses:
+			if isinstance(response, Exception):
+				logger.error("Error analyzing table", exc_info=response)
+			elif response:
+				analysis_results.append({
+					'result': response.get('result'),
+					'code': response.get('python_code'),
+				})
 
 		# Create a system message with analysis results
 		if analysis_results:
-			analysis_results = json.dumps(analysis_results, indent=4, ensure_ascii=False)
+			# Compact JSON: the results only feed the LLM context, where indentation is wasted tokens
+			analysis_results = json.dumps(analysis_results, ensure_ascii=False, separators=(',', ':'))
 			system_message = SystemMessage(
 				content=analysis_results
 			)
@@ -1,13 +1,30 @@
-from langchain_core.prompts import PromptTemplate
-
-from src.constants.llm_constant import AZURE_LLM00
+from src.constants.llm_constant import AZURE_CLASSIFIER_LLM
 from src.services.rag_services.models.graph_builder.models.classify_message import ClassifyMessage
 from src.services.rag_services.models.graph_builder.prompts import CLASSIFY_PROMPT
+from src.utils.cache_helper import LRUCache
+
+# Short messages ("hi", "thanks", "ok") repeat constantly across users; longer ones rarely do
+CLASSIFICATION_CACHE_SIZE = 1024
+MAX_CACHED_MESSAGE_LENGTH = 200
+
+classification_cache: LRUCache[str, str] = LRUCache(CLASSIFICATION_CACHE_SIZE)
+
+# The prompt only substitutes {text}, so it is formatted directly instead of going through a PromptTemplate
+_CLASSIFY_LLM = AZURE_CLASSIFIER_LLM.with_structured_output(ClassifyMessage)
+
+
+def _classification_cache_key(user_message: str) -> str | None:
+    """Normalize case and whitespace so trivial variants share an entry; None when not worth caching."""
+    key = " ".join(user_message.casefold().split())
+    return key if key and len(key) <= MAX_CACHED_MESSAGE_LENGTH else None
 
 
 async def classify_message_node(user_message: str) -> str:
     """Classifies a user message into a specific category.
 
+    The category depends only on the message text, so repeats of a short message are answered
+    from an in-process LRU cache without another LLM call.
+
     Args:
         user_message (str): The message provided by the user to be classified.
 
@@ -15,11 +32,13 @@ async def classify_message_node(user_message: str) -> str:
         str: The category of the message as determined by the LLM.
 
     """
-    prompt = PromptTemplate(
-        template=CLASSIFY_PROMPT,
-        input_variables=["text"],
-    )
-    llm_chain = prompt | AZURE_LLM00.with_structured_output(ClassifyMessage)
-    response = await llm_chain.ainvoke({"text": user_message})
+    cache_key = _classification_cache_key(user_message)
+    if cache_key is not None and (category := classification_cache.get(cache_key)) is not None:
+        return category
+
+    response = await _CLASSIFY_LLM.ainvoke(CLASSIFY_PROMPT.format(text=user_message))
+
+    if cache_key is not None:
+        classification_cache.put(cache_key, response.category)
 
     return response.category
@@ -1,3 +1,5 @@
+import hashlib
+
 from langchain.retrievers.multi_query import LineListOutputParser
 from langchain_core.prompts import (
     ChatPromptTemplate,
@@ -5,7 +7,50 @@ from langchain_core.prompts import (
     MessagesPlaceholder,
 )
 
-from src.constants.llm_constant import AZURE_LLM00
+from src.constants.llm_constant import AZURE_EMBEDDING, AZURE_LLM00
+from src.utils.cache_helper import LRUCache, SemanticCache
+
+QUERIES_CACHE_SIZE = 1024
+# Paraphrases of a standalone question ("reset my password?" / "password reset steps?") get the same rewrites
+SEMANTIC_QUERIES_CACHE_SIZE = 1024
+SEMANTIC_QUERIES_SIMILARITY_THRESHOLD = 0.92
+
+queries_cache: LRUCache[tuple[str, str], list[str]] = LRUCache(QUERIES_CACHE_SIZE)
+semantic_queries_cache: SemanticCache[list[str]] = SemanticCache(
+    SEMANTIC_QUERIES_CACHE_SIZE,
+    SEMANTIC_QUERIES_SIMILARITY_THRESHOLD,
+)
+
+_QUERY_REWRITE_PROMPT = ChatPromptTemplate(
+    [
+        MessagesPlaceholder(variable_name="chat_history"),
+        HumanMessagePromptTemplate.from_template(
+            template=(
+                "You are an AI language model assistant. Your task is "
+                "to generate 3 ENGLISH different versions of the given user "
+                "question to retrieve relevant documents from a vector database. "
+                "By generating multiple perspectives on the user question, "
+                "your goal is to help the user overcome some of the limitations "
+                "of distance-based similarity search. "
+                "\nWhen resolving references in the current question, PRIORITIZE the MOST RECENT "
+                "messages in the chat history. Focus on the immediate context from the latest "
+                "exchange first before considering older messages. "
+                "Make each alternative question standalone and complete with all necessary context. "
+                "Provide these alternative questions separated by newlines. "
+                "\nOriginal question: {question} "
+            ),
+        ),
+    ],
+)
+_QUERY_REWRITE_CHAIN = _QUERY_REWRITE_PROMPT | AZURE_LLM00 | LineListOutputParser()
+
+
+def _histories_digest(histories: list) -> str:
+    """Hash the type and content of each history message; message ids are not stable across requests."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    for message in histories:
+        digest.update(f"{message.type}\x1f{message.content}\x1e".encode())
+    return digest.hexdigest()
 
 
 async def create_queries(human_message: str, histories: list):
@@ -23,31 +68,23 @@ async def create_queries(human_message: str, histories: list):
         list[str]: A list of three alternative queries.
 
     """
-    output_parser = LineListOutputParser()
-    prompt_ = ChatPromptTemplate(
-        [
-            MessagesPlaceholder(variable_name="chat_history"),
-            HumanMessagePromptTemplate.from_template(
-                template=(
-                    "You are an AI language model assistant. Your task is "
-                    "to generate 3 ENGLISH different versions of the given user "
-                    "question to retrieve relevant documents from a vector database. "
-                    "By generating multiple perspectives on the user question, "
-                    "your goal is to help the user overcome some of the limitations "
-                    "of distance-based similarity search. "
-                    "\nWhen resolving references in the current question, PRIORITIZE the MOST RECENT "
-                    "messages in the chat history. Focus on the immediate context from the latest "
-                    "exchange first before considering older messages. "
-                    "Make each alternative question standalone and complete with all necessary context. "
-                    "Provide these alternative questions separated by newlines. "
-                    "\nOriginal question: {question} "
-                ),
-            ),
-        ],
-    )
-    llm_chain = prompt_ | AZURE_LLM00 | output_parser
-    queries = await llm_chain.ainvoke(
+    cache_key = (human_message, _histories_digest(histories))
+    if (queries := queries_cache.get(cache_key)) is not None:
+        return list(queries)
+
+    # With history the rewrites resolve references against it, so only standalone questions are matched by meaning
+    embedding = None
+    if not histories:
+        embedding = await AZURE_EMBEDDING.aembed_query(human_message)
+        if (queries := semantic_queries_cache.get(embedding)) is not None:
+            queries_cache.put(cache_key, list(queries))
+            return list(queries)
+
+    queries = await _QUERY_REWRITE_CHAIN.ainvoke(
         {"question": human_message, "chat_history": histories},
     )
+    queries_cache.put(cache_key, list(queries))
+    if embedding is not None:
+        semantic_queries_cache.put(embedding, list(queries))
 
     return queries
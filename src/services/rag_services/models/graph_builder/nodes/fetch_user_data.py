@@ -1,6 +1,8 @@
-from langchain_postgres import PostgresChatMessageHistory
+import asyncio
 
-from src.constants.db_constant import PG_CONN
+from langchain_core.messages import messages_from_dict
+
+from src.services.postgres.db_utils import get_db_context
 from src.services.postgres.models.tables.rag_sync_db.chat_history_model import (
     ChatHistory,
 )
@@ -26,18 +28,24 @@ async def fetch_conversation_data(conversation_id, k=20):
     if not conversation_id:
         return [], []
 
-    # Retrieve the chat message history for the user
-    history = PostgresChatMessageHistory(
-        ChatHistory.__tablename__,
-        conversation_id,
-        sync_connection=PG_CONN,
+    # The history and the instructions are independent reads, so run them concurrently; each
+    # worker thread gets its own short-lived session since the shared one is not thread-safe
+    stored_messages, prompts = await asyncio.gather(
+        asyncio.to_thread(_load_recent_messages, conversation_id, k),
+        asyncio.to_thread(_load_instruction_prompts, conversation_id),
     )
-    all_messages = history.messages
-    last_20_messages = all_messages[-k:]
-    del all_messages
 
+    return messages_from_dict(stored_messages), prompts
+
+
+def _load_recent_messages(conversation_id: str, k: int) -> list[dict]:
+    # Retrieve only the last `k` messages instead of loading the whole history
+    with get_db_context() as session:
+        return ChatHistory.get_recent_messages(conversation_id, limit=k, db_session=session)
+
+
+def _load_instruction_prompts(conversation_id: str) -> list[dict]:
     # Fetch the instruction prompts associated with the user
     namespace = define_namespace_of_instructions(conversation_id)
-    prompts = get_instruction_prompts(namespace, format_as_bullet_points=True)
-
-    return last_20_messages, prompts
+    with get_db_context() as session:
+        return get_instruction_prompts(namespace, format_as_bullet_points=True, db_session=session)
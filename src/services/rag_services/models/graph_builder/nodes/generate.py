@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
@@ -13,6 +14,12 @@ from src.services.rag_services.models.graph_builder.state import GraphState
 from src.services.rag_services.url_shortening_service import url_shortening_service
 
 
+@lru_cache(maxsize=32)
+def _system_message(language: str | None) -> SystemMessage:
+    """Build the system prompt message once per response language."""
+    return SystemMessage(content=SYSTEM_PROMPT.format(language=language))
+
+
 def _add_to_history_simple(state: GraphState, response_content: str):
     """Simple version of adding messages to history.
 
@@ -56,18 +63,17 @@ def write_prompt(state: GraphState):
         documents,
     )
 
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    personal_instruction_dict = {
-        item["name"]: item["instructions"].encode("utf-8").decode("utf-8") for item in persona_instructions
-    }
     if not using_memory:
         messages = [
-            SystemMessage(content=SYSTEM_PROMPT.format(language=language)),
+            _system_message(language),
             HumanMessage(content=question),
         ]
     else:
+        # Only the memory prompt shows the time and persona instructions
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        personal_instruction_dict = {item["name"]: item["instructions"] for item in persona_instructions}
         messages = [
-            SystemMessage(content=SYSTEM_PROMPT.format(language=language)),
+            _system_message(language),
             MessagesPlaceholder(variable_name="chat_history"),
             HumanMessage(
                 content=HUMAN_PROMPT.format(
@@ -113,32 +119,40 @@ def _define_document_context(
     if classification_message in ("greeting", "feedback"):
         return ""
 
-    # Start building context
-    formatted_contexts = (
-        "Contexts:\n- Document List: These are some of the documents that may be relevant to my question:\n"
-    )
+    # Start building context; parts are joined once at the end instead of copying the string per document
+    context_parts = [
+        "Contexts:\n- Document List: These are some of the documents that may be relevant to my question:\n",
+    ]
 
     # Add document contexts if available
-    formatted_contexts = _add_document_contexts(
-        formatted_contexts,
+    _add_document_contexts(
+        context_parts,
         documents,
     )
 
     # Add analysis results if available
     if analysis_results:
-        formatted_contexts += _format_analysis_results(analysis_results)
+        context_parts.append(_format_analysis_results(analysis_results))
 
-    return formatted_contexts
+    return "".join(context_parts)
 
 
-def _add_document_contexts(formatted_contexts, documents):
-    """Helper function to format document contexts."""
+def _add_document_contexts(context_parts, documents):
+    """Helper function to append formatted document contexts to the context parts."""
     if not documents:
-        formatted_contexts += "No relevant documents found.\n\n"
-        return formatted_contexts
+        context_parts.append("No relevant documents found.\n\n")
+        return
 
     pattern = "{index}. {topic}\n```\n{content}\n```\n\n"
 
+    # Shorten every cited URL in one call instead of one database round trip per document
+    view_urls = [url for doc in documents if (url := doc.get("metadata", {}).get("view_url"))]
+    try:
+        short_urls = url_shortening_service.shorten_urls(view_urls) if view_urls else {}
+    except Exception:
+        # Fallback to original URLs if shortening fails
+        short_urls = {}
+
     for idx, doc in enumerate(documents, 1):
         metadata = doc.get("metadata", {})
         view_url = metadata.get("view_url", None)
@@ -147,27 +161,22 @@ def _add_document_contexts(formatted_contexts, documents):
 
         # Format the topic with URL first
         if view_url:
-            try:
-                # Use URL shortening service for better citation display
-                short_url, _ = url_shortening_service.shorten_url(view_url)
-                topic_with_url = f"**🔗 [{topic}]({short_url}) **"
-            except Exception:
-                # Fallback to original URL if shortening fails
-                topic_with_url = f"**🔗 [{topic}]({view_url}) **"
+            short_url, _ = short_urls.get(view_url, (view_url, None))
+            topic_with_url = f"**🔗 [{topic}]({short_url}) **"
         else:
             topic_with_url = topic
 
         # Add document collection on a new line
         topic_name = f"{topic_with_url}\n**Document Collection: {document_collection} **"
 
-        formatted_contexts += pattern.format(
-            index=idx,
-            topic=topic_name,
-            content=doc["content"],
+        context_parts.append(
+            pattern.format(
+                index=idx,
+                topic=topic_name,
+                content=doc["content"],
+            ),
         )
 
-    return formatted_contexts
-
 
 def _format_analysis_results(analysis_results):
     """Format analysis results for context."""
@@ -181,20 +190,21 @@ async def generate(state: GraphState, writer: StreamWriter):
     """Generate answer."""
     new_prompt = write_prompt(state)
     chain = new_prompt | AZURE_LLM03
-    all_stream = ""
+    chunks: list[str] = []
 
     try:
         async for stream_content in chain.astream(
             {"chat_history": state.get("history", [])},
         ):
             if isinstance(stream_content.content, str):
-                all_stream += stream_content.content
+                chunks.append(stream_content.content)
             else:
                 error_message = f"Stream content is not a string: {stream_content.content}"
                 raise TypeError(error_message)
 
             writer({"generate": stream_content.content})
 
+        all_stream = "".join(chunks)
         # Add current interaction to history with quality checks
         _add_to_history_simple(state, all_stream)
 
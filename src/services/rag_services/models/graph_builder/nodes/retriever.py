@@ -1,36 +1,133 @@
+import asyncio
 import io
 import logging
 import re
 import traceback
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from math import ceil
+from uuid import UUID
+from xml.sax.saxutils import escape as xml_escape
 
+import numpy as np
 import pandas as pd
 from langchain.output_parsers import BooleanOutputParser
-from langchain.retrievers import EnsembleRetriever
 from langchain.retrievers.document_compressors import LLMChainFilter
 from langchain_community.retrievers import BM25Retriever
+from langchain_community.retrievers.bm25 import default_preprocessing_func
 from langchain_core.documents import Document
 from langchain_core.prompts import PromptTemplate
-from sqlalchemy import select
+from rank_bm25 import BM25Okapi
+from sqlalchemy import func, literal_column, select
 
 from src.constants.llm_constant import AZURE_LLM00
 from src.services.rag_services.models.document_retriever import DocumentRetriever
 from src.services.rag_services.models.graph_builder.prompts import RERANKER_PROMPT
+from src.utils.cache_helper import LRUCache
 
 logger = logging.getLogger(__name__)
 
+BM25_CACHE_SIZE = 32
+BM25_LOAD_CHUNK_SIZE = 1000
+
+# collection uuid -> (collection version, BM25 index built from that version)
+bm25_cache: LRUCache[UUID, tuple[tuple[int, int], BM25Retriever]] = LRUCache(BM25_CACHE_SIZE)
+# collection uuid -> lock serializing its index build, and how many turns currently hold or await it
+_bm25_build_locks: dict[UUID, asyncio.Lock] = {}
+_bm25_lock_users: Counter[UUID] = Counter()
+
+
+@asynccontextmanager
+async def _bm25_build_lock(collection_id: UUID) -> AsyncIterator[None]:
+    """Serialize BM25 index builds per collection, dropping the lock once nobody holds or awaits it."""
+    lock = _bm25_build_locks.setdefault(collection_id, asyncio.Lock())
+    _bm25_lock_users[collection_id] += 1
+    try:
+        async with lock:
+            yield
+    finally:
+        _bm25_lock_users[collection_id] -= 1
+        if not _bm25_lock_users[collection_id]:
+            del _bm25_lock_users[collection_id]
+            del _bm25_build_locks[collection_id]
+
+
+class InvertedIndexBM25Okapi(BM25Okapi):
+    """BM25Okapi scoring through an inverted index instead of a Python loop over every document.
+
+    Each term's BM25 contribution to the documents containing it is precomputed when the index
+    is built, so scoring a query only adds those arrays into the documents they belong to. The
+    scores are identical to BM25Okapi's.
+    """
+
+    def __init__(self, corpus: list[list[str]], **kwargs: float) -> None:
+        """Build the BM25 statistics and the per-term postings with their contributions."""
+        super().__init__(corpus, **kwargs)
+        postings: defaultdict[str, tuple[list[int], list[int]]] = defaultdict(lambda: ([], []))
+        for doc_index, frequencies in enumerate(self.doc_freqs):
+            for term, frequency in frequencies.items():
+                doc_indexes, term_frequencies = postings[term]
+                doc_indexes.append(doc_index)
+                term_frequencies.append(frequency)
+
+        length_norm = self.k1 * (1 - self.b + self.b * np.asarray(self.doc_len) / self.avgdl)
+        self.term_scores: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for term, (doc_indexes, term_frequencies) in postings.items():
+            indexes = np.asarray(doc_indexes)
+            frequencies = np.asarray(term_frequencies, dtype=float)
+            contributions = self.idf[term] * (frequencies * (self.k1 + 1) / (frequencies + length_norm[indexes]))
+            self.term_scores[term] = (indexes, contributions)
+
+    def get_scores(self, query: list[str]) -> np.ndarray:
+        """Score every document against the query terms."""
+        score = np.zeros(self.corpus_size)
+        for term in query:
+            if (postings := self.term_scores.get(term)) is not None:
+                indexes, contributions = postings
+                score[indexes] += contributions
+        return score
+
+
+def _build_bm25_retriever(docs: list[Document]) -> BM25Retriever:
+    """Build a BM25Retriever over the documents backed by the inverted-index scorer."""
+    corpus = [default_preprocessing_func(doc.page_content) for doc in docs]
+    return BM25Retriever(
+        vectorizer=InvertedIndexBM25Okapi(corpus),
+        docs=docs,
+        preprocess_func=default_preprocessing_func,
+    )
+
+
+# Same rank constant as LangChain's EnsembleRetriever, so the fused order is unchanged
+RRF_C = 60
+
+
+def _weighted_reciprocal_rank(doc_lists: list[list[Document]], weights: list[float]) -> list[Document]:
+    """Fuse ranked lists by weighted reciprocal rank, ties keeping first-seen order."""
+    scores: defaultdict[str, float] = defaultdict(float)
+    docs_by_id: dict[str, Document] = {}
+    for docs, weight in zip(doc_lists, weights, strict=True):
+        for rank, doc in enumerate(docs, start=1):
+            scores[doc.id] += weight / (rank + RRF_C)
+            docs_by_id.setdefault(doc.id, doc)
+    return [docs_by_id[doc_id] for doc_id in sorted(scores, key=scores.__getitem__, reverse=True)]
+
 
 async def retrieve_unique_docs_by_hybrid_search(
     queries: list[str],
     doc_retriever: DocumentRetriever,
 ):
-    """Retrieve unique documents based on multiple queries using an EnsembleRetriever.
+    """Retrieve unique documents based on multiple queries using a vector and a BM25 retriever.
 
     This function performs a hybrid search by combining results from a vector-based retriever
     and a BM25 retriever. It ensures that the retrieved documents are unique and returns
     a capped number of results.
 
+    All queries are embedded in one request and searched concurrently, while the CPU-bound BM25
+    scoring runs in a worker thread; each query's two result lists are then fused by weighted
+    reciprocal rank as LangChain's EnsembleRetriever would.
+
     Args:
             queries (list[str]): A list of search queries to execute.
             doc_retriever (DocumentRetriever): The document retriever instance used for fetching documents.
@@ -50,46 +147,51 @@ async def retrieve_unique_docs_by_hybrid_search(
     if bm25_retriever is None:
         return []
 
-    # Set up vector retriever
-    vector_retriever = doc_retriever.vector_store.as_retriever(
-        search_kwargs={"k": number_of_docs},
-    )
-
-    # Define weights for the ensemble retriever
+    # Define weights for the fused ranking
     vector_percent = 0.8
     bm25_percent = 0.2
 
-    # Create an ensemble retriever with custom weights
-    ensemble_retriever = EnsembleRetriever(
-        retrievers=[vector_retriever, bm25_retriever],
-        weights=[vector_percent, bm25_percent],  # 80% weight to vector, 20% to BM25
-    )
-
-    all_results = []
     queries = [query for query in queries if query]  # Filter out empty queries
+    vector_store = doc_retriever.vector_store
 
-    # Run all queries concurrently using the ensemble retriever
-    retrieved_docs = await ensemble_retriever.abatch(queries)
-    retrieved_docs_flattened = [doc for docs in retrieved_docs for doc in docs]
+    async def vector_search() -> list[list[Document]]:
+        embeddings = await vector_store.embeddings.aembed_documents(queries)
+        return await asyncio.gather(
+            *(vector_store.asimilarity_search_by_vector(embedding, k=number_of_docs) for embedding in embeddings),
+        )
 
-    unique_ids = set()
+    # Run all queries concurrently on both retrievers
+    vector_docs, bm25_docs = await asyncio.gather(
+        vector_search(),
+        asyncio.to_thread(lambda: [bm25_retriever.invoke(query) for query in queries]),
+    )
+    # Lazily fuse query by query so the walk below can stop once enough docs are collected
+    retrieved_docs_flattened = (
+        doc
+        for query_docs in zip(vector_docs, bm25_docs, strict=True)
+        for doc in _weighted_reciprocal_rank(list(query_docs), [vector_percent, bm25_percent])
+    )
+
+    collection_name = (
+        f"Your Collection: {doc_retriever.collection_base_name}"
+        if doc_retriever.is_user_collection
+        else doc_retriever.collection_name
+    )
+    unique_docs = {}
     for doc in retrieved_docs_flattened:
-        if doc.id not in unique_ids:
-            doc.metadata["collection_name"] = (
-                f"Your Collection: {doc_retriever.collection_base_name}"
-                if doc_retriever.is_user_collection
-                else doc_retriever.collection_name
-            )
-            result = {
-                "content": doc.page_content,
-                "metadata": doc.metadata,
-                "id": doc.id,
-                "retrieval_method": "ensemble",
-            }
-            all_results.append(result)
-            unique_ids.add(doc.id)
+        if doc.id in unique_docs:
+            continue
+        doc.metadata["collection_name"] = collection_name
+        unique_docs[doc.id] = {
+            "content": doc.page_content,
+            "metadata": doc.metadata,
+            "id": doc.id,
+            "retrieval_method": "ensemble",
+        }
+        if len(unique_docs) == max_return_docs:
+            break
 
-    return all_results[:max_return_docs]
+    return list(unique_docs.values())
 
 
 async def create_bm25_retriever(doc_retriever: DocumentRetriever, number_of_docs: int):
@@ -99,6 +201,11 @@ async def create_bm25_retriever(doc_retriever: DocumentRetriever, number_of_docs
     provided `doc_retriever`, converts them into LangChain `Document` objects,
     and initializes a BM25 retriever with the specified number of documents.
 
+    Building the index reads and tokenizes the whole collection, so it is cached per collection
+    and only rebuilt when the collection's version changes: its row count plus the newest row
+    `xmin`, which moves on every insert or update and, with the count, catches deletes too. This
+    also notices ingestion done by other instances.
+
     Args:
             doc_retriever (DocumentRetriever): The document retriever instance containing
                     the vector store and collection information.
@@ -109,34 +216,43 @@ async def create_bm25_retriever(doc_retriever: DocumentRetriever, number_of_docs
             None: If no documents are found in the vector store.
 
     """
-    async with doc_retriever.vector_store.session_maker() as session:
+    vector_store = doc_retriever.vector_store
+    embedding_table = vector_store.EmbeddingStore
+    async with vector_store.session_maker() as session:
         # First get the collection ID
-        collection = await doc_retriever.vector_store.aget_collection(session)
+        collection = await vector_store.aget_collection(session)
         collection_id = collection.uuid
-        # Then query the embedding store table directly
-        embedding_table = doc_retriever.vector_store.EmbeddingStore
-        statement = select(embedding_table).where(
+        version_statement = select(func.count(), func.max(literal_column("xmin::text::bigint"))).where(
             embedding_table.collection_id == collection_id,
         )
-        db_collection = await session.execute(statement)
-
-    if not db_collection:
-        return None
-
-    # Fix: Correctly access the attributes from the EmbeddingStore object
-    langchain_docs = [
-        Document(
-            page_content=row.EmbeddingStore.document,
-            metadata=row.EmbeddingStore.cmetadata or {},
-            id=row.EmbeddingStore.id,
-        )
-        for row in db_collection
-    ]
-    if len(langchain_docs) == 0:
+        version = tuple((await session.execute(version_statement)).one())
+    if not version[0]:
         return None
-    bm25_retriever = BM25Retriever.from_documents(langchain_docs, k=number_of_docs)
 
-    return bm25_retriever
+    async with _bm25_build_lock(collection_id):
+        cached = bm25_cache.get(collection_id)
+        if cached is None or cached[0] != version:
+            # Then query the embedding store table directly; BM25 needs no vectors, and the
+            # rows are streamed in chunks instead of buffering the whole result first
+            statement = (
+                select(embedding_table.id, embedding_table.document, embedding_table.cmetadata)
+                .where(embedding_table.collection_id == collection_id)
+                .execution_options(yield_per=BM25_LOAD_CHUNK_SIZE)
+            )
+            async with vector_store.session_maker() as session:
+                db_collection = await session.stream(statement)
+                langchain_docs = [
+                    Document(page_content=row.document, metadata=row.cmetadata or {}, id=row.id)
+                    async for row in db_collection
+                ]
+            # Tokenizing the corpus is CPU-bound, keep it off the event loop; the connection
+            # is already back in the pool by now
+            bm25_retriever = await asyncio.to_thread(_build_bm25_retriever, langchain_docs)
+            cached = (version, bm25_retriever)
+            bm25_cache.put(collection_id, cached)
+
+    # Concurrent turns ask for different k, so each gets a shallow copy sharing the index
+    return cached[1].model_copy(update={"k": number_of_docs})
 
 
 def fusion_docs(docs: list[dict]):
@@ -216,16 +332,17 @@ def dataframe_to_xml(df, root_name="root", row_name="row"):
     xml_parts = ['<?xml version="1.0" encoding="UTF-8"?>', f"<{root_name}>"]
     column_map = {col: simple_sanitize_xml_tag(col) for col in df.columns}
 
-    for idx, row in df.iterrows():
+    # Build each column's elements in one pass, then stitch rows together instead of iterrows()
+    column_parts = []
+    for position, col in enumerate(df.columns):
+        tag = column_map[col]
+        values = df.iloc[:, position]
+        elements = f"    <{tag}>" + values.astype(str).map(xml_escape, na_action="ignore") + f"</{tag}>"
+        column_parts.append(elements.where(values.notna(), f'    <{tag} xsi:nil="true"/>'))
+
+    for cells in zip(*column_parts, strict=True):
         xml_parts.append(f"  <{row_name}>")
-        for col, value in row.items():
-            if pd.isna(value):
-                xml_parts.append(f'    <{column_map[col]} xsi:nil="true"/>')
-            else:
-                escaped_value = re.escape(str(value))
-                xml_parts.append(
-                    f"    <{column_map[col]}>{escaped_value}</{column_map[col]}>",
-                )
+        xml_parts.extend(cells)
         xml_parts.append(f"  </{row_name}>")
 
     xml_parts.append(f"</{root_name}>")
@@ -19,22 +19,23 @@ INSTRUCTION_SET_PATTERN = """
   ```"""
 
 
-def get_instruction_prompts(namespace, format_as_bullet_points=False):
+def get_instruction_prompts(namespace, format_as_bullet_points=False, db_session=None):
     """
     Retrieves a list of instruction prompts for a given namespace.
 
     Args:
             namespace (tuple): A tuple representing the namespace for the instructions.
             format_as_bullet_points (bool, optional): If True, formats the instructions as bullet points. Defaults to False.
+            db_session (Session, optional): Session to read with instead of the shared one. Defaults to None.
 
     Returns:
             list: A list of dictionaries, each containing the name, instructions, and purpose of an instruction set.
     """
 
     def get_procedural_memory(namespace, key, default_value=None):
-        stored_value = ConversationInstructions.get(namespace, key)
+        stored_value = ConversationInstructions.get_value(namespace, key, db_session=db_session)
         return (
-            stored_value.value.get("instructions", default_value)
+            stored_value.get("instructions", default_value)
             if stored_value
             else default_value
         )
@@ -105,10 +106,12 @@ def format_instruction_sets(prompts):
     )
 
 
-def save_instruction_prompts(conversation_id, user_message, histories=None):
+async def save_instruction_prompts(conversation_id, user_message, histories=None):
     """
     Saves updated instruction prompts for a user based on their feedback and conversation history.
 
+    The LLM call is awaited so the sibling graph branch (create_queries) keeps running meanwhile.
+
     Args:
             conversation_id (str): The unique identifier of the conversation.
             user_message (str): The latest message from the user.
@@ -138,7 +141,7 @@ def save_instruction_prompts(conversation_id, user_message, histories=None):
         )
         | write_instruction_llm
     )
-    response: AllUpdatedInstructions = chain.invoke(
+    response: AllUpdatedInstructions = await chain.ainvoke(
         {
             "instruction_sets": format_instruction_sets(prompts),
             "chat_history": format_chat_history_,
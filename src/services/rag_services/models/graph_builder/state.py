@@ -14,6 +14,7 @@ class GraphState(MessagesState):
     tables: list[pd.DataFrame]
     chat_state: dict
     history: list
+    recent_history: list
     instructions: list[dict]
     debug: dict
     classification_message: str
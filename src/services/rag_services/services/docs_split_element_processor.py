@@ -30,6 +30,8 @@ _logger = logging.getLogger("DocsSplitElementsProcessor")
 class DocsSplitElementsProcessor:
     """Processor for splitting elements from a document."""
 
+    MAX_CONCURRENT_IMAGE_SUMMARIES = 5
+
     def __init__(self, doc_retriever: DocumentRetriever) -> None:
         """Initialize the processor."""
         self.doc_retriever = doc_retriever
@@ -63,12 +65,22 @@ class DocsSplitElementsProcessor:
         # Export elements
         texts = [element.export() for element in text_elements]
         tables = [element.export() for element in table_elements]
-        images = [element.export(image_collection=image_data) for element in image_elements]
+        images = await self._export_images(image_elements, image_data)
         # Add documents to the in-memory store
         await self.doc_retriever.add_documents(texts, filename, "text", topic_name, view_url)
         await self.doc_retriever.add_documents(tables, filename, "table", topic_name, view_url)
         await self.doc_retriever.add_documents(images, filename, "image", topic_name, view_url)
 
+    async def _export_images(self, image_elements: list[GroupDocsElement], image_data: dict) -> list:
+        """Export image groups with their LLM summaries requested concurrently, in the original order."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_IMAGE_SUMMARIES)
+
+        async def export_one(element: GroupDocsElement):
+            async with semaphore:
+                return await element.aexport(image_collection=image_data)
+
+        return list(await asyncio.gather(*(export_one(element) for element in image_elements)))
+
     async def _process_file_with_extension(
         self,
         file_path: str,
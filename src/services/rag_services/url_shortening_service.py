@@ -6,20 +6,39 @@ while maintaining the original URL for all other URLs. This improves citation re
 in chat responses without losing functionality.
 """
 
+import logging
 import re
+import threading
+import time
+from datetime import datetime, timezone
 from urllib.parse import urlparse
 from typing import Optional, Tuple
 from src.config.settings import url_shortening_domain
+from src.services.postgres.db_utils import get_db_context
 from src.services.postgres.models.tables.rag_sync_db.url_shortening_table import (
     URLShortening,
 )
+from src.utils.cache_helper import LRUCache
+
+logger = logging.getLogger(__name__)
 
 
 class URLShorteningService:
     """Service for managing URL shortening for citations - Microsoft URLs only"""
 
+    ORIGINAL_URL_CACHE_SIZE = 50_000
+    SHORT_CODE_CACHE_SIZE = 10_000
+    ACCESS_FLUSH_INTERVAL_SECONDS = 30
+
     def __init__(self):
         self.base_domain = url_shortening_domain
+        # A mapping is never changed once created, so cached entries in either direction need no invalidation
+        self._original_url_cache: LRUCache[str, str] = LRUCache(self.ORIGINAL_URL_CACHE_SIZE)
+        self._short_code_cache: LRUCache[str, str] = LRUCache(self.SHORT_CODE_CACHE_SIZE)
+        # short_code -> (access count, last access time) not yet written to the database
+        self._pending_accesses: dict[str, tuple[int, datetime]] = {}
+        self._last_access_flush = time.monotonic()
+        self._lock = threading.Lock()
 
     def shorten_url(self, original_url: str) -> Tuple[str, str]:
         """
@@ -44,16 +63,52 @@ class URLShorteningService:
         # Generate display URL for Microsoft URLs
         display_url = self._format_display_url(original_url)
 
-        # Get or create URL mapping in database
-        url_mapping = URLShortening.create_or_get_mapping(
-            original_url=original_url, display_url=display_url
-        )
+        # Cited documents recur across answers, so only the first citation of a URL goes to the database
+        short_code = self._short_code_cache.get(original_url)
+        if short_code is None:
+            url_mapping = URLShortening.create_or_get_mapping(
+                original_url=original_url, display_url=display_url
+            )
+            short_code = url_mapping.short_code
+            self._short_code_cache.put(original_url, short_code)
+            self._original_url_cache.put(short_code, original_url)
 
         # Construct short URL for Microsoft URLs
-        short_url = f"{self.base_domain}/redirect/{url_mapping.short_code}"
+        short_url = f"{self.base_domain}/redirect/{short_code}"
 
         return short_url, display_url
 
+    def shorten_urls(self, original_urls: list[str]) -> dict[str, Tuple[str, str]]:
+        """
+        Shorten many URLs with at most one database round trip for the uncached ones
+
+        Args:
+            original_urls: The full URLs to shorten
+
+        Returns:
+            Mapping of each original URL to its (short_url, display_url), as shorten_url would return
+        """
+        shortened: dict[str, Tuple[str, str]] = {}
+        display_urls: dict[str, str] = {}
+        for original_url in dict.fromkeys(original_urls):
+            if self._is_microsoft_url(original_url):
+                display_urls[original_url] = self._format_display_url(original_url)
+            else:
+                shortened[original_url] = (original_url, self._format_non_microsoft_display_url(original_url))
+
+        short_codes = {url: self._short_code_cache.get(url) for url in display_urls}
+        uncached_display_urls = {url: display_urls[url] for url, code in short_codes.items() if code is None}
+        if uncached_display_urls:
+            created = URLShortening.create_or_get_mappings(uncached_display_urls)
+            for original_url, short_code in created.items():
+                self._short_code_cache.put(original_url, short_code)
+                self._original_url_cache.put(short_code, original_url)
+            short_codes.update(created)
+
+        for original_url, display_url in display_urls.items():
+            shortened[original_url] = (f"{self.base_domain}/redirect/{short_codes[original_url]}", display_url)
+        return shortened
+
     def get_original_url(self, short_code: str) -> Optional[str]:
         """
         Retrieve the original URL for a given short code
@@ -64,12 +119,46 @@ class URLShorteningService:
         Returns:
             Original URL if found, None otherwise
         """
-        url_mapping = URLShortening.get_by_short_code(short_code)
-        if url_mapping:
-            # Record the access for analytics
-            url_mapping.record_access()
-            return url_mapping.original_url
-        return None
+        original_url = self._original_url_cache.get(short_code)
+        if original_url is None:
+            # A short-lived session keeps this safe to call from worker threads
+            with get_db_context() as session:
+                original_url = URLShortening.get_original_url_by_short_code(short_code, db_session=session)
+            if original_url is None:
+                return None
+            self._original_url_cache.put(short_code, original_url)
+
+        # Record the access for analytics
+        self._record_access(short_code)
+        return original_url
+
+    def _record_access(self, short_code: str) -> None:
+        """
+        Buffer an access and periodically write the buffered accesses in one batch
+
+        Accesses are written at most every ACCESS_FLUSH_INTERVAL_SECONDS, so the redirect
+        path does not pay for an UPDATE and commit on every hit.
+        """
+        with self._lock:
+            count, _ = self._pending_accesses.get(short_code, (0, None))
+            self._pending_accesses[short_code] = (count + 1, datetime.now(timezone.utc))
+            if time.monotonic() - self._last_access_flush < self.ACCESS_FLUSH_INTERVAL_SECONDS:
+                return
+        self.flush_access_counts()
+
+    def flush_access_counts(self) -> None:
+        """Write all buffered accesses to the database"""
+        with self._lock:
+            pending_accesses = self._pending_accesses
+            self._pending_accesses = {}
+            self._last_access_flush = time.monotonic()
+
+        try:
+            with get_db_context() as session:
+                URLShortening.record_accesses(pending_accesses, db_session=session)
+        except Exception:
+            # Access statistics are best effort and must not fail the redirect
+            logger.exception("Failed to record URL accesses")
 
     def _is_microsoft_url(self, url: str) -> bool:
         """
@@ -0,0 +1,93 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+
+
+class LRUCache[K: Hashable, V]:
+    """Thread-safe in-process LRU cache for results of async calls, where functools.lru_cache does not apply."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Create an empty cache holding at most maxsize entries."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value and mark it as recently used, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+
+class SemanticCache[V]:
+    """Thread-safe in-process cache looked up by cosine similarity of embeddings; the oldest entry is evicted first."""
+
+    def __init__(self, maxsize: int, threshold: float) -> None:
+        """Create an empty cache holding at most maxsize entries that match at or above threshold."""
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._vectors: np.ndarray | None = None
+        self._values: list[V | None] = [None] * maxsize
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, embedding: list[float]) -> V | None:
+        """Return the value of the most similar entry if it clears the threshold, otherwise None."""
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._vectors is None or not self._size:
+                return None
+            scores = self._vectors[: self._size] @ vector
+            best = int(np.argmax(scores))
+            return self._values[best] if scores[best] >= self.threshold else None
+
+    def put(self, embedding: list[float], value: V) -> None:
+        """Store a value under its embedding, overwriting the oldest entry when full."""
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.maxsize, vector.shape[0]), dtype=np.float32)
+            self._vectors[self._next] = vector
+            self._values[self._next] = value
+            self._next = (self._next + 1) % self.maxsize
+            self._size = min(self._size + 1, self.maxsize)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._vectors = None
+            self._values = [None] * self.maxsize
+            self._size = 0
+            self._next = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return self._size
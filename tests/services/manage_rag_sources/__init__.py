@@ -0,0 +1 @@
+# Test package for manage_rag_sources
@@ -0,0 +1,84 @@
+# Import necessary modules for testing
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.manage_rag_sources.services import source_helpers
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+def _source(source_id, name):
+    return SimpleNamespace(id=source_id, name=name)
+
+
+class TestGetAvailableSources:
+    """Unit tests for get_available_sources."""
+
+    @pytest.fixture
+    def mock_db(self):
+        """Patch the db interface so each worker thread gets a mock session."""
+        with patch.object(source_helpers, "db") as mock_db:
+            mock_db.create_session.side_effect = MagicMock
+            yield mock_db
+
+    @pytest.fixture
+    def mock_manage_source(self):
+        """Patch the ManageSource queries."""
+        with patch.object(source_helpers, "ManageSource") as mock_manage_source:
+            mock_manage_source.get_common_source_names.return_value = [_source(1, "common-a"), _source(2, "common-b")]
+            mock_manage_source.get_source_name_by_user_id.return_value = [_source(3, "user-a")]
+            yield mock_manage_source
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_db")
+    async def test_common_and_user_sources_are_flattened_in_order(self, mock_manage_source):
+        """Common sources come first, followed by the user's sources."""
+        result = await source_helpers.get_available_sources(user_id="user-1")
+
+        assert result == [
+            {"id": 1, "name": "common-a"},
+            {"id": 2, "name": "common-b"},
+            {"id": 3, "name": "user-a"},
+        ]
+        assert mock_manage_source.get_source_name_by_user_id.call_args.kwargs["user_id"] == "user-1"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_db")
+    async def test_each_query_uses_its_own_closed_session(self, mock_manage_source):
+        """The concurrent queries never share the global session."""
+        await source_helpers.get_available_sources(user_id="user-1")
+
+        common_session = mock_manage_source.get_common_source_names.call_args.kwargs["db"]
+        user_session = mock_manage_source.get_source_name_by_user_id.call_args.kwargs["db"]
+        assert common_session is not user_session
+        common_session.close.assert_called_once()
+        user_session.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_db")
+    async def test_without_user_only_common_sources_are_fetched(self, mock_manage_source):
+        """No user query is issued when user_id is missing."""
+        result = await source_helpers.get_available_sources()
+
+        assert [source["name"] for source in result] == ["common-a", "common-b"]
+        mock_manage_source.get_source_name_by_user_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_db")
+    async def test_errors_return_an_empty_list(self, mock_manage_source):
+        """A failing query is logged and yields no sources."""
+        mock_manage_source.get_common_source_names.side_effect = RuntimeError("db down")
+
+        assert await source_helpers.get_available_sources(user_id="user-1") == []
@@ -0,0 +1 @@
+# Test package for postgres models
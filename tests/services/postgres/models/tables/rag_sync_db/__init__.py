@@ -0,0 +1 @@
+# Test package for rag_sync_db tables
@@ -0,0 +1,35 @@
+# Import necessary modules for testing
+import os
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.postgres.models.tables.rag_sync_db.chat_history_model import ChatHistory
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestChatHistoryGetRecentMessages:
+    """Unit tests for ChatHistory.get_recent_messages."""
+
+    def test_reads_only_the_tail_and_returns_it_oldest_first(self):
+        """The query is limited in SQL and the newest-first rows are reversed."""
+        session = MagicMock()
+        session.scalars.return_value.all.return_value = [{"n": 3}, {"n": 2}]
+
+        messages = ChatHistory.get_recent_messages("conversation", limit=2, db_session=session)
+
+        assert messages == [{"n": 2}, {"n": 3}]
+        sql = str(session.scalars.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "WHERE chat_history.session_id = " in sql
+        assert "ORDER BY chat_history.id DESC" in sql
+        assert "LIMIT" in sql
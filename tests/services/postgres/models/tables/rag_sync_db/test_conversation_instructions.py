@@ -0,0 +1,82 @@
+# Import necessary modules for testing
+import os
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.postgres.models.tables.rag_sync_db.conversation_instructions import ConversationInstructions
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+@pytest.fixture
+def mock_db():
+    """Patch the shared db interface used by the model."""
+    with patch("src.services.postgres.models.tables.rag_sync_db.conversation_instructions.db") as mock_db:
+        yield mock_db
+
+
+class TestConversationInstructionsPut:
+    """Unit tests for ConversationInstructions.put."""
+
+    def test_put_issues_a_single_upsert_and_commits(self, mock_db):
+        """A single INSERT ... ON CONFLICT statement is issued and committed."""
+        ConversationInstructions.put(("user-1", "instructions"), "agent_a", {"instructions": "be brief"})
+
+        mock_db.session.execute.assert_called_once()
+        stmt = mock_db.session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "INSERT INTO conversation_instructions" in sql
+        assert "ON CONFLICT ON CONSTRAINT uq_namespace_instruction DO UPDATE" in sql
+        assert "updated_at = now()" in sql
+        mock_db.session.query.assert_not_called()
+        mock_db.session.commit.assert_called_once()
+
+    def test_put_serializes_namespace(self, mock_db):
+        """Tuple namespaces are stored as dot-separated strings."""
+        ConversationInstructions.put(("user-1", "instructions"), "agent_a", {"instructions": "be brief"})
+
+        params = mock_db.session.execute.call_args.args[0].compile(dialect=postgresql.dialect()).params
+        assert params["namespace"] == "user-1.instructions"
+        assert params["key"] == "agent_a"
+
+    def test_put_rolls_back_on_failure(self, mock_db):
+        """A failed upsert rolls back the session and re-raises."""
+        mock_db.session.execute.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            ConversationInstructions.put(("user-1", "instructions"), "agent_a", {"instructions": "be brief"})
+
+        mock_db.session.rollback.assert_called_once()
+        mock_db.session.commit.assert_not_called()
+
+
+class TestConversationInstructionsGetValue:
+    """Unit tests for ConversationInstructions.get_value."""
+
+    def test_get_value_selects_only_the_value_column(self, mock_db):
+        """Only the value column is read for the serialized namespace."""
+        query = mock_db.session.query.return_value
+        query.filter_by.return_value.scalar.return_value = {"instructions": "be brief"}
+
+        result = ConversationInstructions.get_value(("user-1", "instructions"), "agent_a")
+
+        assert result == {"instructions": "be brief"}
+        mock_db.session.query.assert_called_once_with(ConversationInstructions.value)
+        query.filter_by.assert_called_once_with(namespace="user-1.instructions", key="agent_a")
+
+    def test_get_value_returns_none_when_missing(self, mock_db):
+        """A missing record yields None."""
+        mock_db.session.query.return_value.filter_by.return_value.scalar.return_value = None
+
+        assert ConversationInstructions.get_value(("user-1", "instructions"), "agent_a") is None
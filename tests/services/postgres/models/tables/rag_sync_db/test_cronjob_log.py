@@ -0,0 +1,52 @@
+# Import necessary modules for testing
+import os
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.postgres.models.tables.rag_sync_db.cronjob_log import CronJobLog
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestCronJobLogGetMinuteRangeLatestUpdate:
+    """Unit tests for CronJobLog.get_minute_range_latest_update."""
+
+    def test_unknown_collection_id_returns_none(self):
+        """An unknown collection id matches no log and yields None in one query."""
+        session = MagicMock()
+        session.execute.return_value.scalar.return_value = None
+
+        assert CronJobLog.get_minute_range_latest_update(collection_id=999, db_session=session) is None
+        session.execute.assert_called_once()
+        session.query.assert_not_called()
+
+    def test_collection_id_is_resolved_by_subquery(self):
+        """The collection name lookup is embedded in the log query."""
+        session = MagicMock()
+        session.execute.return_value.scalar.return_value = 4.0
+
+        assert CronJobLog.get_minute_range_latest_update(collection_id=7, db_session=session) == 4
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "(SELECT collections.name" in sql
+        assert "= ANY (cronjob_log.updated_rag_sources)" in sql
+
+    def test_collection_name_is_used_directly(self):
+        """A collection name skips the collection subquery."""
+        session = MagicMock()
+        session.execute.return_value.scalar.return_value = 12.0
+
+        assert CronJobLog.get_minute_range_latest_update(collection_name="docs", db_session=session) == 12
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "collections" not in sql
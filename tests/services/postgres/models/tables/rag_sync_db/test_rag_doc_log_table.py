@@ -0,0 +1,67 @@
+# Import necessary modules for testing
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.postgres.models.tables.rag_sync_db.rag_doc_log_table import DocumentLog, SourceType
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestDocumentLogGetExistingPages:
+    """Unit tests for DocumentLog.get_existing_pages."""
+
+    @pytest.fixture
+    def mock_db(self):
+        """Patch the shared db interface used by the model."""
+        with patch("src.services.postgres.models.tables.rag_sync_db.rag_doc_log_table.db") as mock_db:
+            yield mock_db
+
+    @staticmethod
+    def _set_existing(mock_db, names) -> None:
+        query = mock_db.session.query.return_value
+        query.filter.return_value.all.return_value = [SimpleNamespace(identity_constant_name=name) for name in names]
+
+    def test_splits_found_and_missing_pages(self, mock_db):
+        """Pages present in the log are returned as existing, the rest as missing."""
+        self._set_existing(mock_db, ["page-1", "page-3"])
+
+        existing, missing = DocumentLog.get_existing_pages(1, SourceType.CONFLUENCE, ["page-1", "page-2", "page-3"])
+
+        assert sorted(existing) == ["page-1", "page-3"]
+        assert missing == ["page-2"]
+
+    def test_duplicate_page_ids_are_deduplicated(self, mock_db):
+        """Each page id appears at most once in either result list."""
+        self._set_existing(mock_db, ["page-1"])
+
+        existing, missing = DocumentLog.get_existing_pages(
+            1, SourceType.CONFLUENCE, ["page-1", "page-2", "page-1", "page-2"],
+        )
+
+        assert existing == ["page-1"]
+        assert missing == ["page-2"]
+
+    def test_only_identity_column_is_selected(self, mock_db):
+        """The lookup selects the identity column rather than whole rows."""
+        self._set_existing(mock_db, [])
+
+        DocumentLog.get_existing_pages(1, SourceType.CONFLUENCE, ["page-1"])
+
+        mock_db.session.query.assert_called_once_with(DocumentLog.identity_constant_name)
+
+    def test_empty_page_ids_skip_the_query(self, mock_db):
+        """No query is issued when there is nothing to look up."""
+        assert DocumentLog.get_existing_pages(1, SourceType.CONFLUENCE, []) == ([], [])
+        mock_db.session.query.assert_not_called()
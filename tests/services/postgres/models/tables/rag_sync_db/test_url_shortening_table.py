@@ -0,0 +1,164 @@
+# Import necessary modules for testing
+import os
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.postgres.models.tables.rag_sync_db.url_shortening_table import URLShortening
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestURLShorteningCreateOrGetMapping:
+    """Unit tests for URLShortening.create_or_get_mapping."""
+
+    @pytest.fixture
+    def session(self):
+        """A mock session whose statement returns a stored mapping."""
+        session = MagicMock()
+        session.scalars.return_value.first.return_value = URLShortening(short_code="abc123")
+        return session
+
+    @staticmethod
+    def _statements(session) -> list:
+        return [call.args[0] for call in session.scalars.call_args_list]
+
+    def test_single_statement_returns_the_mapping(self, session):
+        """Lookup, code generation and insert collapse into one statement that never rewrites a row."""
+        mapping = URLShortening.create_or_get_mapping("https://x.sharepoint.com/doc", "x", db_session=session)
+
+        assert mapping.short_code == "abc123"
+        (stmt,) = self._statements(session)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "WHERE NOT (EXISTS (SELECT" in sql
+        assert "ON CONFLICT (original_url) DO NOTHING RETURNING" in sql
+        assert "DO UPDATE" not in sql
+        session.commit.assert_called_once()
+
+    def test_short_code_collision_is_retried_with_a_new_candidate(self, session):
+        """An IntegrityError on the short code retries inside a fresh savepoint."""
+        stored = URLShortening(short_code="def456")
+        session.scalars.return_value.first.side_effect = [IntegrityError("insert", {}, Exception()), stored]
+
+        with patch.object(URLShortening, "generate_short_code", side_effect=["taken1", "free22"]):
+            mapping = URLShortening.create_or_get_mapping("https://x.sharepoint.com/doc", "x", db_session=session)
+
+        assert mapping is stored
+        codes = [stmt.compile(dialect=postgresql.dialect()).params["short_code"] for stmt in self._statements(session)]
+        assert codes == ["taken1", "free22"]
+        assert session.begin_nested.call_count == 2
+
+    def test_lost_insert_race_is_retried(self, session):
+        """An empty result means a concurrent insert won, so the next attempt reads that row."""
+        stored = URLShortening(short_code="def456")
+        session.scalars.return_value.first.side_effect = [None, stored]
+
+        mapping = URLShortening.create_or_get_mapping("https://x.sharepoint.com/doc", "x", db_session=session)
+
+        assert mapping is stored
+        assert session.scalars.call_count == 2
+
+    def test_gives_up_after_max_attempts(self, session):
+        """Persistent collisions raise instead of looping forever."""
+        session.scalars.return_value.first.side_effect = IntegrityError("insert", {}, Exception())
+
+        with pytest.raises(RuntimeError):
+            URLShortening.create_or_get_mapping("https://x.sharepoint.com/doc", "x", db_session=session)
+
+        assert session.scalars.call_count == URLShortening.MAX_SHORT_CODE_ATTEMPTS
+        session.rollback.assert_called_once()
+
+
+class TestURLShorteningCreateOrGetMappings:
+    """Unit tests for URLShortening.create_or_get_mappings."""
+
+    def test_existing_and_new_urls_take_one_select_and_one_insert(self):
+        """Known URLs come from one IN lookup and the rest from one multi-row insert."""
+        session = MagicMock()
+        session.execute.side_effect = [[("https://a", "aaa111")], [("https://b", "bbb222"), ("https://c", "ccc333")]]
+
+        short_codes = URLShortening.create_or_get_mappings(
+            {"https://a": "a", "https://b": "b", "https://c": "c"},
+            db_session=session,
+        )
+
+        assert short_codes == {"https://a": "aaa111", "https://b": "bbb222", "https://c": "ccc333"}
+        select_stmt, insert_stmt = (call.args[0] for call in session.execute.call_args_list)
+        assert "IN (__[POSTCOMPILE_original_url_1])" in str(select_stmt.compile(dialect=postgresql.dialect()))
+        insert_sql = str(insert_stmt.compile(dialect=postgresql.dialect()))
+        assert insert_sql.count("VALUES") == 1
+        assert "ON CONFLICT DO NOTHING RETURNING" in insert_sql
+        session.commit.assert_called_once()
+
+    def test_rows_skipped_by_a_conflict_are_retried(self):
+        """A URL whose insert was skipped is looked up again and, if still missing, reinserted."""
+        session = MagicMock()
+        session.execute.side_effect = [[], [], [], [("https://a", "aaa111")]]
+
+        short_codes = URLShortening.create_or_get_mappings({"https://a": "a"}, db_session=session)
+
+        assert short_codes == {"https://a": "aaa111"}
+        assert session.execute.call_count == 4
+
+
+class TestURLShorteningGenerateShortCode:
+    """Unit tests for URLShortening.generate_short_code."""
+
+    def test_codes_are_alphanumeric_and_fixed_length(self):
+        """Codes fit the short_code column and never contain URL-safe punctuation."""
+        codes = [URLShortening.generate_short_code() for _ in range(1000)]
+
+        assert all(len(code) == URLShortening.SHORT_CODE_LENGTH and code.isalnum() for code in codes)
+
+
+class TestURLShorteningGetByShortCode:
+    """Unit tests for URLShortening.get_by_short_code."""
+
+    def test_lookup_reuses_one_limited_statement(self):
+        """Every call binds the code into the same LIMIT 1 statement."""
+        session = MagicMock()
+
+        URLShortening.get_by_short_code("abc123", db_session=session)
+        URLShortening.get_by_short_code("def456", db_session=session)
+
+        first, second = session.scalars.call_args_list
+        assert first.args[0] is second.args[0]
+        assert second.args[1] == {"short_code": "def456"}
+        assert "LIMIT" in str(first.args[0].compile(dialect=postgresql.dialect()))
+
+
+class TestURLShorteningRecordAccesses:
+    """Unit tests for URLShortening.record_accesses."""
+
+    def test_buffered_accesses_are_applied_in_one_statement(self):
+        """All codes are updated from a single VALUES list and committed once."""
+        session = MagicMock()
+        accessed_at = datetime.now(UTC)
+
+        URLShortening.record_accesses({"abc123": (3, accessed_at), "def456": (1, accessed_at)}, db_session=session)
+
+        session.execute.assert_called_once()
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "access_count=(url_shortening.access_count + pending.delta)" in sql
+        assert "AS pending (short_code, delta, accessed_at)" in sql
+        session.commit.assert_called_once()
+
+    def test_nothing_is_written_without_accesses(self):
+        """An empty buffer skips the database."""
+        session = MagicMock()
+
+        URLShortening.record_accesses({}, db_session=session)
+
+        session.execute.assert_not_called()
@@ -0,0 +1,108 @@
+# Import necessary modules for testing
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.postgres.document_rag import DocumentRag
+        from src.services.postgres.models.tables.rag_sync_db.rag_doc_log_table import SourceType, SyncLog
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestDocumentRagUpsertFiles:
+    """Unit tests for DocumentRag.upsert_files."""
+
+    @pytest.fixture
+    def mock_db(self):
+        """Patch the shared db interface."""
+        with patch("src.services.postgres.document_rag.db") as mock_db:
+            yield mock_db
+
+    @pytest.fixture
+    def document_rag(self):
+        """Create a DocumentRag for collection 7."""
+        collection = MagicMock()
+        collection.id = 7
+        return DocumentRag(collection)
+
+    @staticmethod
+    def _executed_statements(mock_db) -> list:
+        return [call.args[0] for call in mock_db.session.execute.call_args_list]
+
+    @staticmethod
+    def _file(name, **extra) -> dict:
+        return {"identity_constant_name": name, "display_name": name, "content_hash": "hash", **extra}
+
+    def test_rows_carry_their_source_type_for_the_conflict_target(self, mock_db, document_rag):
+        """An existing GCP row is matched on its own source type instead of the CONFLUENCE default."""
+        document_rag.upsert_files(
+            [
+                self._file("gcp-doc", source_type=SourceType.GCP, source_path="bucket/folder"),
+                self._file("confluence-doc"),
+            ],
+        )
+
+        (stmt,) = self._executed_statements(mock_db)
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert params["source_type_m0"] == SourceType.GCP
+        assert params["source_path_m0"] == "bucket/folder"
+        assert params["source_type_m1"] == SourceType.CONFLUENCE
+        mock_db.session.commit.assert_called_once()
+
+    def test_existing_rows_are_updated_in_place(self, mock_db, document_rag):
+        """The statement updates on the unique constraint instead of inserting a duplicate."""
+        document_rag.upsert_files([self._file("doc", source_type="GCP")])
+
+        (stmt,) = self._executed_statements(mock_db)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (identity_constant_name, collection_id, source_type) DO UPDATE" in sql
+        assert "content_hash = excluded.content_hash" in sql
+        assert "source_path = excluded.source_path" in sql
+
+    def test_same_name_in_different_sources_is_kept(self, mock_db, document_rag):
+        """Only duplicates of the full conflict target are collapsed."""
+        document_rag.upsert_files(
+            [
+                self._file("doc", source_type=SourceType.GCP),
+                self._file("doc", source_type=SourceType.CONFLUENCE),
+                self._file("doc", source_type=SourceType.CONFLUENCE, content_hash="newer"),
+            ],
+        )
+
+        (stmt,) = self._executed_statements(mock_db)
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert params["source_type_m0"] == SourceType.GCP
+        assert params["source_type_m1"] == SourceType.CONFLUENCE
+        assert params["content_hash_m1"] == "newer"
+        assert "source_type_m2" not in params
+
+    def test_sync_log_is_committed_with_the_upsert(self, mock_db, document_rag):
+        """The sync log row joins the upsert transaction instead of committing separately."""
+        document_rag.upsert_files([self._file("doc")], notes="synced")
+
+        (sync_log,) = [call.args[0] for call in mock_db.session.add.call_args_list]
+        assert isinstance(sync_log, SyncLog)
+        assert sync_log.collection_id == 7
+        assert sync_log.notes == "synced"
+        mock_db.session.commit.assert_called_once()
+
+    def test_failed_upsert_rolls_back(self, mock_db, document_rag):
+        """A failing statement rolls the session back and re-raises."""
+        mock_db.session.execute.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            document_rag.upsert_files([self._file("doc")])
+
+        mock_db.session.rollback.assert_called_once()
+        mock_db.session.commit.assert_not_called()
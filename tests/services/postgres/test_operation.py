@@ -0,0 +1,188 @@
+# Import necessary modules for testing
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.postgres.models.tables.rag_sync_db.conversation_instructions import ConversationInstructions
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestDatabaseOperationBulkUpsert:
+    """Unit tests for DatabaseOperation.bulk_upsert."""
+
+    @staticmethod
+    def _rows(count) -> list[dict]:
+        return [{"namespace": "ns", "key": f"key-{i}", "value": {"i": i}} for i in range(count)]
+
+    def test_rows_are_sent_in_multi_row_batches(self):
+        """Each batch is one INSERT ... ON CONFLICT statement, committed once at the end."""
+        session = MagicMock()
+
+        count = ConversationInstructions.bulk_upsert(
+            self._rows(5), keys=["namespace", "key"], batch_size=2, db_session=session,
+        )
+
+        assert count == 5
+        statements = [call.args[0].compile(dialect=postgresql.dialect()) for call in session.execute.call_args_list]
+        assert [sum(name.startswith("key_m") for name in stmt.params) for stmt in statements] == [2, 2, 1]
+        assert "ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value" in str(statements[0])
+        session.commit.assert_called_once()
+
+    def test_key_only_rows_do_nothing_on_conflict(self):
+        """Rows without non-key columns skip the update clause."""
+        session = MagicMock()
+        rows = [{"namespace": "ns", "key": "k"}]
+
+        ConversationInstructions.bulk_upsert(rows, keys=["namespace", "key"], db_session=session)
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (namespace, key) DO NOTHING" in sql
+
+    def test_empty_rows_skip_the_database(self):
+        """Nothing is executed or committed for an empty batch."""
+        session = MagicMock()
+
+        assert ConversationInstructions.bulk_upsert([], keys=["namespace", "key"], db_session=session) == 0
+        session.execute.assert_not_called()
+        session.commit.assert_not_called()
+
+
+class TestDatabaseOperationUpsert:
+    """Unit tests for DatabaseOperation.upsert."""
+
+    def test_values_are_bound_at_execute_time(self):
+        """The statement carries no values, so its cache key is stable across calls."""
+        session = MagicMock()
+
+        ConversationInstructions.upsert(["namespace", "key"], db_session=session, namespace="ns", key="k", value={})
+        ConversationInstructions.upsert(["namespace", "key"], db_session=session, namespace="ns", key="j", value={})
+
+        first, second = session.execute.call_args_list
+        assert first.args[1] == {"namespace": "ns", "key": "k", "value": {}}
+        compiled = [call.args[0].compile(dialect=postgresql.dialect()) for call in (first, second)]
+        assert str(compiled[0]) == str(compiled[1])
+        assert not any(compiled[0].params.values())
+        assert "ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value" in str(compiled[0])
+
+
+class TestDatabaseOperationFindByFilter:
+    """Unit tests for DatabaseOperation.find_by_filter."""
+
+    def test_limit_is_applied_after_the_filters(self):
+        """_limit caps the query without being treated as a column filter."""
+        session = MagicMock()
+        filtered = session.query.return_value.filter_by.return_value
+
+        ConversationInstructions.find_by_filter(key="agent_a", _limit=1, db_session=session)
+
+        session.query.return_value.filter_by.assert_called_once_with(key="agent_a")
+        filtered.limit.assert_called_once_with(1)
+
+
+class TestDatabaseOperationCommit:
+    """Unit tests for the commit flag on mutating DatabaseOperation methods."""
+
+    def test_commit_false_only_flushes(self):
+        """Callers can group several writes and commit them once."""
+        session = MagicMock()
+
+        ConversationInstructions.delete_by_filter(db_session=session, commit=False, key="agent_a")
+        ConversationInstructions.create(db_session=session, commit=False, namespace="ns", key="k", value={})
+
+        assert session.flush.call_count == 2
+        session.commit.assert_not_called()
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql == "DELETE FROM conversation_instructions WHERE conversation_instructions.key = %(key_1)s::VARCHAR"
+
+    def test_commit_defaults_to_true(self):
+        """Existing callers keep committing on every call."""
+        session = MagicMock()
+
+        ConversationInstructions.delete_by_filter(db_session=session, key="agent_a")
+
+        session.commit.assert_called_once()
+        session.flush.assert_not_called()
+
+
+class TestDatabaseOperationDeleteByFilter:
+    """Unit tests for DatabaseOperation.delete_by_filter."""
+
+    def test_deletes_in_bulk_without_synchronizing_the_session(self):
+        """One DELETE statement, with no identity-map bookkeeping and no return value by default."""
+        session = MagicMock()
+
+        assert ConversationInstructions.delete_by_filter(db_session=session, key="agent_a") is None
+
+        stmt = session.execute.call_args.args[0]
+        assert stmt.get_execution_options()["synchronize_session"] is False
+        session.query.assert_not_called()
+
+    def test_returning_ids_surfaces_deleted_primary_keys(self):
+        """returning_ids adds DELETE ... RETURNING instead of a preceding SELECT."""
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = [1, 2]
+
+        deleted = ConversationInstructions.delete_by_filter(db_session=session, returning_ids=True, key="agent_a")
+
+        assert deleted == [1, 2]
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.endswith("RETURNING conversation_instructions.id")
+
+
+class TestDatabaseOperationFindByFilterRaw:
+    """Unit tests for DatabaseOperation.find_by_filter_raw."""
+
+    def test_selects_requested_columns_with_lookups(self):
+        """Only the named columns are selected and lookups are applied as in find_by_filter."""
+        session = MagicMock()
+        session.execute.return_value.mappings.return_value.all.return_value = [{"key": "agent_a"}]
+
+        rows = ConversationInstructions.find_by_filter_raw(
+            columns=["key"], namespace="ns", key__startswith="agent", _limit=1, db_session=session,
+        )
+
+        assert rows == [{"key": "agent_a"}]
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT conversation_instructions.key \nFROM conversation_instructions")
+        assert "conversation_instructions.key LIKE" in sql
+        assert "conversation_instructions.namespace =" in sql
+        assert "LIMIT" in sql
+
+    def test_each_lookup_suffix_maps_to_its_operator(self):
+        """Comparison, pattern and null lookups compile to the matching SQL operators."""
+        session = MagicMock()
+
+        ConversationInstructions.find_by_filter_raw(
+            columns=["key"],
+            id__gte=1,
+            id__lt=9,
+            id__in=[1, 2],
+            key__icontains="agent",
+            namespace__isnull=False,
+            db_session=session,
+        )
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "conversation_instructions.id >=" in sql
+        assert "conversation_instructions.id <" in sql
+        assert "conversation_instructions.id IN" in sql
+        assert "conversation_instructions.key ILIKE" in sql
+        assert "conversation_instructions.namespace IS NOT NULL" in sql
+
+    def test_unknown_lookup_suffix_is_rejected(self):
+        """A suffix outside the supported lookups raises instead of being ignored."""
+        with pytest.raises(ValueError, match="Unsupported lookup type: regex"):
+            ConversationInstructions.find_by_filter_raw(columns=["key"], key__regex="a.*", db_session=MagicMock())
@@ -0,0 +1,53 @@
+# Import necessary modules for testing
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.rag_services.models.graph_builder.nodes import analysis_table
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestAnalysisTable:
+    """Unit tests for analysis_table."""
+
+    @pytest.mark.asyncio
+    async def test_failed_table_does_not_drop_the_others(self, caplog):
+        """A table whose analysis raises is logged with its traceback and skipped while the rest are returned."""
+
+        def post(df, question):
+            if df == "bad":
+                message = "boom"
+                raise RuntimeError(message)
+            return {"result": f"{df}:{question}", "python_code": "print(1)"}
+
+        with patch.object(analysis_table.TableAnalysisController, "post", side_effect=post):
+            response = await analysis_table.analysis_table(can_analyze=True, human_message="q", dfs=["a", "bad", "b"])
+
+        assert json.loads(response["analysis_results"]) == [
+            {"result": "a:q", "code": "print(1)"},
+            {"result": "b:q", "code": "print(1)"},
+        ]
+        (record,) = caplog.records
+        assert record.levelname == "ERROR"
+        assert isinstance(record.exc_info[1], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_skips_when_analysis_is_disabled(self):
+        """Nothing is posted when the analyze flag is off."""
+        with patch.object(analysis_table.TableAnalysisController, "post") as post:
+            response = await analysis_table.analysis_table(can_analyze=False, human_message="q", dfs=["a"])
+
+        post.assert_not_called()
+        assert response == {"messages": [], "analysis_results": ""}
@@ -0,0 +1,52 @@
+# Import necessary modules for testing
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.rag_services.models.graph_builder.nodes import classify_message
+        from src.utils.cache_helper import LRUCache
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestClassifyMessageNode:
+    """Unit tests for classify_message_node."""
+
+    @pytest.fixture
+    def chain(self):
+        """Patch the classify LLM and start from an empty cache."""
+        with (
+            patch.object(classify_message, "_CLASSIFY_LLM") as chain,
+            patch.object(classify_message, "classification_cache", LRUCache(8)),
+        ):
+            chain.ainvoke = AsyncMock(return_value=SimpleNamespace(category="greeting"))
+            yield chain
+
+    @pytest.mark.asyncio
+    async def test_repeated_short_message_skips_the_llm(self, chain):
+        """Case and whitespace variants of a short message reuse the first classification."""
+        assert await classify_message.classify_message_node("Hi there") == "greeting"
+        assert await classify_message.classify_message_node("  hi   THERE ") == "greeting"
+
+        chain.ainvoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_long_messages_are_not_cached(self, chain):
+        """Messages past the length cap always go to the LLM."""
+        message = "x" * (classify_message.MAX_CACHED_MESSAGE_LENGTH + 1)
+
+        await classify_message.classify_message_node(message)
+        await classify_message.classify_message_node(message)
+
+        assert chain.ainvoke.await_count == 2
@@ -0,0 +1,85 @@
+# Import necessary modules for testing
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.rag_services.models.graph_builder.nodes import create_queries
+        from src.utils.cache_helper import LRUCache, SemanticCache
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+def _message(type_: str, content: str) -> SimpleNamespace:
+    return SimpleNamespace(type=type_, content=content)
+
+
+class TestCreateQueries:
+    """Unit tests for create_queries."""
+
+    @pytest.fixture
+    def chain(self):
+        """Patch the query rewrite chain and start from an empty cache."""
+        with (
+            patch.object(create_queries, "_QUERY_REWRITE_CHAIN") as chain,
+            patch.object(create_queries, "queries_cache", LRUCache(8)),
+            patch.object(create_queries, "semantic_queries_cache", SemanticCache(8, 0.92)),
+            patch.object(create_queries, "AZURE_EMBEDDING") as embedding,
+        ):
+            embedding.aembed_query = AsyncMock(
+                side_effect=lambda text: [1.0, 0.0] if "password" in text else [0.0, 1.0],
+            )
+            chain.ainvoke = AsyncMock(return_value=["q1", "q2", "q3"])
+            yield chain
+
+    @pytest.mark.asyncio
+    async def test_same_question_and_history_skips_the_llm(self, chain):
+        """An identical question over an identical history reuses the first result."""
+        first = await create_queries.create_queries("what is x?", [_message("human", "hi"), _message("ai", "hello")])
+        second = await create_queries.create_queries("what is x?", [_message("human", "hi"), _message("ai", "hello")])
+
+        assert first == second == ["q1", "q2", "q3"]
+        chain.ainvoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_different_history_goes_to_the_llm(self, chain):
+        """A changed history can change the resolved references, so it is a cache miss."""
+        await create_queries.create_queries("what is it?", [_message("human", "tell me about x")])
+        await create_queries.create_queries("what is it?", [_message("human", "tell me about y")])
+
+        assert chain.ainvoke.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_paraphrased_standalone_question_skips_the_llm(self, chain):
+        """A question embedding close to a cached one reuses its rewrites when there is no history."""
+        await create_queries.create_queries("how do I reset my password?", [])
+        queries = await create_queries.create_queries("password reset steps?", [])
+
+        assert queries == ["q1", "q2", "q3"]
+        chain.ainvoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_question_goes_to_the_llm(self, chain):
+        """A question below the similarity threshold is a cache miss."""
+        await create_queries.create_queries("how do I reset my password?", [])
+        await create_queries.create_queries("where is the holiday calendar?", [])
+
+        assert chain.ainvoke.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_questions_with_history_are_not_matched_by_meaning(self, chain):
+        """Rewrites that depend on the history are only reused on an exact match."""
+        await create_queries.create_queries("how do I reset my password?", [])
+        await create_queries.create_queries("password reset steps?", [_message("human", "hi")])
+
+        assert chain.ainvoke.await_count == 2
@@ -0,0 +1,240 @@
+# Import necessary modules for testing
+import os
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from rank_bm25 import BM25Okapi
+from sqlalchemy import Column, String
+from sqlalchemy.orm import declarative_base
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.rag_services.models.graph_builder.nodes import retriever
+        from src.utils.cache_helper import LRUCache
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class _AsyncRows:
+    """Async iterator over rows, standing in for a streamed result."""
+
+    def __init__(self, rows: list) -> None:
+        self._rows = iter(rows)
+
+    def __aiter__(self) -> "_AsyncRows":
+        return self
+
+    async def __anext__(self) -> SimpleNamespace:
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class EmbeddingStore(declarative_base()):
+    """Minimal stand-in for the PGVector embedding table."""
+
+    __tablename__ = "langchain_pg_embedding"
+
+    id = Column(String, primary_key=True)
+    collection_id = Column(String)
+    document = Column(String)
+    cmetadata = Column(String)
+
+
+class TestCreateBm25Retriever:
+    """Unit tests for create_bm25_retriever."""
+
+    @pytest.fixture
+    def session(self):
+        """A session that reports a collection version before every document load."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+        session.stream = AsyncMock(side_effect=lambda _statement: _AsyncRows([]))
+        return session
+
+    @pytest.fixture
+    def doc_retriever(self, session):
+        """A document retriever whose vector store hands out the mock session."""
+        vector_store = MagicMock(EmbeddingStore=EmbeddingStore)
+        vector_store.session_maker.return_value.__aenter__ = AsyncMock(return_value=session)
+        vector_store.session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
+        vector_store.aget_collection = AsyncMock(return_value=SimpleNamespace(uuid=uuid.uuid4()))
+        return SimpleNamespace(vector_store=vector_store)
+
+    @pytest.fixture
+    def bm25(self):
+        """Patch the BM25 index build and start from an empty cache."""
+        with (
+            patch.object(retriever, "_build_bm25_retriever") as bm25,
+            patch.object(retriever, "bm25_cache", LRUCache(4)),
+        ):
+            yield bm25
+
+    @staticmethod
+    def _version(count: int, xmin: int) -> MagicMock:
+        result = MagicMock()
+        result.one.return_value = (count, xmin)
+        return result
+
+    @pytest.mark.asyncio
+    async def test_unchanged_collection_reuses_the_index(self, doc_retriever, session, bm25):
+        """Only the version probe runs again while the collection is unchanged."""
+        session.execute.side_effect = [self._version(1, 10), self._version(1, 10)]
+        session.stream.side_effect = lambda _statement: _AsyncRows(
+            [SimpleNamespace(document="d", cmetadata=None, id="1")],
+        )
+
+        await retriever.create_bm25_retriever(doc_retriever, 4)
+        await retriever.create_bm25_retriever(doc_retriever, 8)
+
+        bm25.assert_called_once()
+        session.stream.assert_awaited_once()
+        (statement,) = session.stream.await_args.args
+        assert [column.name for column in statement.selected_columns] == ["id", "document", "cmetadata"]
+        index = bm25.return_value
+        assert [call.kwargs for call in index.model_copy.call_args_list] == [
+            {"update": {"k": 4}},
+            {"update": {"k": 8}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_changed_collection_rebuilds_the_index(self, doc_retriever, session, bm25):
+        """A new version after ingestion reloads the documents."""
+        session.execute.side_effect = [self._version(1, 10), self._version(2, 11)]
+
+        await retriever.create_bm25_retriever(doc_retriever, 4)
+        await retriever.create_bm25_retriever(doc_retriever, 4)
+
+        assert bm25.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_index_is_built_after_the_session_closes(self, doc_retriever, session, bm25):
+        """The connection goes back to the pool before tokenizing, and the build lock is dropped afterwards."""
+        session.execute.side_effect = [self._version(1, 10)]
+        session_exit = doc_retriever.vector_store.session_maker.return_value.__aexit__
+        closed_sessions = []
+
+        def build(_docs: list) -> MagicMock:
+            closed_sessions.append(session_exit.await_count)
+            return MagicMock()
+
+        bm25.side_effect = build
+
+        with patch.object(retriever, "_bm25_build_locks", {}) as locks:
+            await retriever.create_bm25_retriever(doc_retriever, 4)
+
+        # One session probed the version and a second streamed the documents
+        assert closed_sessions == [2]
+        assert not locks
+
+    @pytest.mark.asyncio
+    async def test_empty_collection_has_no_retriever(self, doc_retriever, session, bm25):
+        """No rows means no BM25 index at all."""
+        session.execute.side_effect = [self._version(0, None)]
+
+        assert await retriever.create_bm25_retriever(doc_retriever, 4) is None
+        bm25.assert_not_called()
+
+
+def _doc(doc_id: str) -> SimpleNamespace:
+    return SimpleNamespace(id=doc_id, page_content=doc_id, metadata={})
+
+
+class TestRetrieveUniqueDocsByHybridSearch:
+    """Unit tests for retrieve_unique_docs_by_hybrid_search."""
+
+    @pytest.mark.asyncio
+    async def test_queries_are_embedded_in_one_request(self):
+        """Every query shares one embedding call and is fused by reciprocal rank with its own BM25 results."""
+        vector_store = MagicMock()
+        vector_store.embeddings.aembed_documents = AsyncMock(return_value=[[1.0], [2.0]])
+        vector_store.asimilarity_search_by_vector = AsyncMock(
+            side_effect=lambda embedding, **_: [_doc(f"v{embedding[0]:.0f}"), _doc("shared")],
+        )
+        doc_retriever = SimpleNamespace(
+            vector_store=vector_store,
+            is_user_collection=False,
+            collection_name="kb",
+        )
+        bm25 = MagicMock()
+        bm25.invoke.side_effect = lambda query: [_doc("shared"), _doc(f"b-{query}")]
+
+        with patch.object(retriever, "create_bm25_retriever", AsyncMock(return_value=bm25)):
+            docs = await retriever.retrieve_unique_docs_by_hybrid_search(["q1", "q2"], doc_retriever)
+
+        vector_store.embeddings.aembed_documents.assert_awaited_once_with(["q1", "q2"])
+        # "shared" is found by both retrievers so it ranks first; later duplicates are dropped
+        assert [doc["id"] for doc in docs] == ["shared", "v1", "b-q1", "v2", "b-q2"]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_return_docs(self):
+        """Collection stops at 30 unique docs and each one is tagged with the user collection name."""
+        vector_store = MagicMock()
+        vector_store.embeddings.aembed_documents = AsyncMock(return_value=[[1.0]])
+        vector_store.asimilarity_search_by_vector = AsyncMock(return_value=[_doc(f"v{i}") for i in range(40)])
+        doc_retriever = SimpleNamespace(
+            vector_store=vector_store,
+            is_user_collection=True,
+            collection_base_name="notes",
+        )
+        bm25 = MagicMock()
+        bm25.invoke.return_value = []
+
+        with patch.object(retriever, "create_bm25_retriever", AsyncMock(return_value=bm25)):
+            docs = await retriever.retrieve_unique_docs_by_hybrid_search(["q1"], doc_retriever)
+
+        assert [doc["id"] for doc in docs] == [f"v{i}" for i in range(30)]
+        assert {doc["metadata"]["collection_name"] for doc in docs} == {"Your Collection: notes"}
+
+
+class TestInvertedIndexBM25Okapi:
+    """Unit tests for InvertedIndexBM25Okapi."""
+
+    def test_scores_match_bm25_okapi(self):
+        """The inverted index gives the same scores as the reference implementation."""
+        corpus = [
+            ["vacation", "policy", "for", "employees"],
+            ["how", "to", "reset", "a", "password"],
+            ["password", "policy", "password", "rotation"],
+            ["holiday", "calendar"],
+        ]
+        query = ["password", "policy", "password", "unknown"]
+
+        np.testing.assert_allclose(
+            retriever.InvertedIndexBM25Okapi(corpus).get_scores(query),
+            BM25Okapi(corpus).get_scores(query),
+        )
+
+
+class TestDataframeToXml:
+    """Unit tests for dataframe_to_xml."""
+
+    def test_escapes_values_and_marks_missing_cells(self):
+        """Cell values are XML-escaped and missing cells become nil elements."""
+        df = pd.DataFrame({"plan name": ["Gold.A", None], "price": ["<10 & up>", "5"]})
+
+        assert retriever.dataframe_to_xml(df) == (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            "<root>\n"
+            "  <row>\n"
+            "    <plan_name>Gold.A</plan_name>\n"
+            "    <price>&lt;10 &amp; up&gt;</price>\n"
+            "  </row>\n"
+            "  <row>\n"
+            '    <plan_name xsi:nil="true"/>\n'
+            "    <price>5</price>\n"
+            "  </row>\n"
+            "</root>"
+        )
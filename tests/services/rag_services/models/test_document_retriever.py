@@ -0,0 +1,142 @@
+# Import necessary modules for testing
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import openai
+import pytest
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.rag_services.models.document_retriever import DocumentRetriever
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+def _rate_limit_error() -> openai.RateLimitError:
+    response = httpx.Response(429, headers={"retry-after": "0"}, request=httpx.Request("POST", "https://test"))
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+class TestDocumentRetrieverAddDocuments:
+    """Unit tests for DocumentRetriever.add_documents."""
+
+    @pytest.fixture
+    def retriever(self):
+        """A retriever with a mocked vector store, skipping PGVector initialization."""
+        retriever = DocumentRetriever.__new__(DocumentRetriever)
+        retriever.collection_name = "test"
+        retriever.vector_store = AsyncMock()
+        retriever.remove_documents = AsyncMock()
+        return retriever
+
+    @staticmethod
+    def _texts(count) -> list:
+        return [SimpleNamespace(text=f"chunk {i}", metadata={}, base64=None) for i in range(count)]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_added_without_sleeping(self, retriever):
+        """Every batch is stored once and no fixed delay is awaited between batches."""
+        with (
+            patch("src.services.rag_services.models.document_retriever.asyncio.sleep") as sleep,
+            patch("src.services.rag_services.models.document_retriever.fastapi_settings") as settings,
+        ):
+            settings.vector_store.embedding_batch_size = 2
+            settings.vector_store.embedding_max_concurrency = 2
+            await retriever.add_documents(self._texts(5), "doc.pdf")
+
+        batches = [call.kwargs["texts"] for call in retriever.vector_store.aadd_texts.call_args_list]
+        assert sorted(batches) == [["chunk 0", "chunk 1"], ["chunk 2", "chunk 3"], ["chunk 4"]]
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_batch_is_retried(self, retriever):
+        """A 429 from the embedding provider backs off and retries the same batch."""
+        retriever.vector_store.aadd_texts.side_effect = [_rate_limit_error(), None]
+
+        await retriever.add_documents(self._texts(1), "doc.pdf")
+
+        assert retriever.vector_store.aadd_texts.call_count == 2
+        retriever.remove_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_removes_the_document(self, retriever):
+        """A non-retryable failure cleans up the partially added document and re-raises."""
+        retriever.vector_store.aadd_texts.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await retriever.add_documents(self._texts(3), "doc.pdf")
+
+        retriever.remove_documents.assert_awaited_once_with("doc.pdf")
+
+    @pytest.mark.asyncio
+    async def test_table_content_is_prefixed_with_titles_and_topic(self, retriever):
+        """Table items are stored as "<titles>: <topic>: <text>" while other types keep their text."""
+        table = SimpleNamespace(text="a;b", metadata={"titles": ["Intro", "Setup"]}, base64=None)
+
+        await retriever.add_documents([table], "doc.pdf", doc_type="table", topic_name="Guide")
+
+        kwargs = retriever.vector_store.aadd_texts.call_args.kwargs
+        assert kwargs["texts"] == ["Intro, Setup: Guide: a;b"]
+        assert kwargs["metadatas"] == [
+            {
+                "document_name": "doc.pdf",
+                "type": "table",
+                "titles": "Intro, Setup",
+                "topic": "Guide",
+                "view_url": None,
+                "table": "a;b",
+            },
+        ]
+
+    @pytest.mark.asyncio
+    async def test_blank_input_is_skipped(self, retriever):
+        """Nothing is stored when every text is empty or whitespace."""
+        texts = [SimpleNamespace(text=text, metadata={}, base64=None) for text in (" \n\t", "")]
+
+        await retriever.add_documents(texts, "doc.pdf")
+
+        retriever.vector_store.aadd_texts.assert_not_called()
+
+
+class TestDocumentRetrieverRemoveDocuments:
+    """Unit tests for DocumentRetriever.remove_documents_batch."""
+
+    @pytest.fixture
+    def session(self):
+        """An async session whose DELETE reports two removed rows."""
+        session = AsyncMock()
+        session.execute.return_value = SimpleNamespace(rowcount=2)
+        return session
+
+    @pytest.fixture
+    def retriever(self, session):
+        """A retriever whose async session maker yields the mocked session."""
+        retriever = DocumentRetriever.__new__(DocumentRetriever)
+        retriever.collection_name = "test"
+        retriever.vector_store = AsyncMock()
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__.return_value = session
+        with patch.object(DocumentRetriever, "async_session_maker", session_maker):
+            yield retriever
+
+    @pytest.mark.asyncio
+    async def test_prefixes_are_deleted_in_one_statement(self, retriever, session):
+        """One DELETE ... USING removes every matching row without a SELECT or adelete."""
+        assert await retriever.remove_documents_batch(["a.pdf", "b.pdf"]) is True
+
+        (statement, params), _ = session.execute.call_args
+        assert str(statement).startswith("DELETE FROM langchain_pg_embedding")
+        assert "LIKE :doc_id_pattern_0 OR e.cmetadata ->> 'document_name' LIKE :doc_id_pattern_1" in str(statement)
+        assert params == {"collection_name": "test", "doc_id_pattern_0": "a.pdf%", "doc_id_pattern_1": "b.pdf%"}
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+        retriever.vector_store.adelete.assert_not_called()
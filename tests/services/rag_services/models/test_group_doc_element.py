@@ -0,0 +1,184 @@
+# Import necessary modules for testing
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.rag_services.models.docs_split_elements_models import group_doc_element
+        from src.services.rag_services.models.docs_split_elements_models.doc_element_type import DocElementTypeEnum
+        from src.services.rag_services.models.docs_split_elements_models.group_doc_element import (
+            GroupDocsElement,
+            _parse_html_tables,
+        )
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestParseHtmlTables:
+    """Unit tests for _parse_html_tables."""
+
+    def test_first_row_is_the_header(self):
+        """Header cells become columns and cell text is whitespace-normalized."""
+        html = "<table><tr><th>Name</th><th>Owner</th></tr><tr><td> Teams \n bot </td><td>IFD</td></tr></table>"
+
+        (df,) = _parse_html_tables(html)
+
+        assert list(df.columns) == ["Name", "Owner"]
+        assert df.to_dict("records") == [{"Name": "Teams bot", "Owner": "IFD"}]
+
+    def test_spanning_cells_fill_every_slot(self):
+        """Spanning columns and rows repeat the cell text like pandas.read_html does."""
+        html = (
+            "<table><tr><th>A</th><th>B</th><th>C</th></tr>"
+            "<tr><td rowspan='2'>x</td><td colspan='2'>y</td></tr>"
+            "<tr><td>1</td><td>2</td></tr></table>"
+        )
+
+        (df,) = _parse_html_tables(html)
+
+        assert df.values.tolist() == [["x", "y", "y"], ["x", "1", "2"]]
+
+    def test_blank_and_repeated_headers_get_unique_names(self):
+        """Blank header cells are named by position and repeated names are suffixed like pandas.read_html."""
+        html = "<table><tr><th colspan='2'>Plan</th><th></th></tr><tr><td>a</td><td>b</td><td>c</td></tr></table>"
+
+        (df,) = _parse_html_tables(html)
+
+        assert list(df.columns) == ["Plan", "Plan.1", "Unnamed: 2"]
+
+    def test_nested_table_rows_are_not_counted_twice(self):
+        """Rows of a nested table only appear in the DataFrame of that table."""
+        html = (
+            "<table><tr><th>Outer</th></tr>"
+            "<tr><td><table><tr><th>Inner</th></tr><tr><td>1</td></tr></table></td></tr></table>"
+        )
+
+        outer, inner = _parse_html_tables(html)
+
+        assert outer.shape == (1, 1)
+        assert inner.to_dict("records") == [{"Inner": "1"}]
+
+
+class TestGroupDocsElementTableDf:
+    """Unit tests for the table DataFrame of a GroupDocsElement."""
+
+    def test_table_html_is_parsed_once(self):
+        """The shape and the export reuse the DataFrame built on first access."""
+
+        class FakeTable(SimpleNamespace):
+            pass
+
+        html = "<table><tr><th>A</th></tr><tr><td>1</td></tr></table>"
+        element = FakeTable(text="", metadata=SimpleNamespace(text_as_html=html, filename="doc.docx"))
+        group = GroupDocsElement([], [element], DocElementTypeEnum.TABLE)
+
+        with (
+            patch.object(group_doc_element, "Table", FakeTable),
+            patch.object(group_doc_element, "_parse_html_tables", wraps=_parse_html_tables) as parse,
+        ):
+            assert group.shape == (1, 1)
+            group.export(export_table_as_df=True)
+
+        parse.assert_called_once_with(html)
+
+    def test_tables_with_spanned_and_blank_headers_are_combined(self):
+        """Tables whose headers contain colspans or blank cells still concatenate into one DataFrame."""
+
+        class FakeTable(SimpleNamespace):
+            pass
+
+        htmls = [
+            "<table><tr><th colspan='2'>Plan</th><th></th></tr><tr><td>a</td><td>b</td><td>c</td></tr></table>",
+            "<table><tr><th>Plan</th><th>Cost</th></tr><tr><td>d</td><td>5</td></tr></table>",
+        ]
+        elements = [
+            FakeTable(text="", metadata=SimpleNamespace(text_as_html=html, filename="doc.docx")) for html in htmls
+        ]
+        group = GroupDocsElement([], elements, DocElementTypeEnum.TABLE)
+
+        with patch.object(group_doc_element, "Table", FakeTable):
+            assert group.shape == (2, 4)
+
+
+class TestGroupDocsElementMetadata:
+    """Unit tests for GroupDocsElement.metadata."""
+
+    @staticmethod
+    def _group(titles) -> GroupDocsElement:
+        elements = [SimpleNamespace(text="body", metadata=SimpleNamespace(filename="doc.docx"))]
+        return GroupDocsElement([SimpleNamespace(text=t) for t in titles], elements, DocElementTypeEnum.TEXT)
+
+    def test_special_separators_are_stripped_from_titles(self):
+        """Non-breaking spaces and full-width punctuation are removed from every title."""
+        group = self._group(["Intro\xa0duction\u3002", "Set\u200bup"])
+
+        assert group.metadata["titles"] == ["Introduction", "Setup"]
+
+    def test_metadata_is_built_once_and_returned_as_a_copy(self):
+        """Repeated access reuses the cached dict while callers can still mutate what they get."""
+        group = self._group(["Intro"])
+
+        first = group.metadata
+        first["titles"].append("changed")
+        first["topic"] = "changed"
+
+        assert group.metadata == {"titles": ["Intro"], "topic": "doc.docx", "type": "text"}
+
+    def test_input_titles_are_merged_without_duplicates(self):
+        """Titles from input metadata are appended in order, skipping ones already present."""
+        base = self._group(["Intro", "Setup"])
+        input_metadata = {"titles": ["Setup", "Usage", "Usage"]}
+        group = GroupDocsElement(base.titles, base.elements, DocElementTypeEnum.TEXT, input_metadata)
+
+        assert group.metadata["titles"] == ["Intro", "Setup", "Usage"]
+
+
+class TestGroupDocsElementCombine:
+    """Unit tests for GroupDocsElement.combine."""
+
+    def test_shared_titles_are_kept_once(self):
+        """A heading present in both groups is not repeated in the combined elements."""
+
+        class FakeTitle(SimpleNamespace):
+            pass
+
+        metadata = SimpleNamespace(filename="doc.docx")
+        heading = FakeTitle(id="t1", text="Intro", metadata=metadata)
+        first = GroupDocsElement([heading], [SimpleNamespace(text="a", metadata=metadata)], DocElementTypeEnum.TEXT)
+        second = GroupDocsElement([heading], [SimpleNamespace(text="b", metadata=metadata)], DocElementTypeEnum.TEXT)
+
+        with patch.object(group_doc_element, "Title", FakeTitle):
+            combined = GroupDocsElement.combine(first, second)
+
+        assert [e.text for e in combined.elements] == ["Intro", "a", "b"]
+
+
+class TestGroupDocsElementAexport:
+    """Unit tests for GroupDocsElement.aexport."""
+
+    @pytest.mark.asyncio
+    async def test_image_summary_is_awaited(self):
+        """Image groups are summarized through the async LLM call and the placeholder is replaced."""
+        metadata = SimpleNamespace(filename="doc.docx")
+        element = SimpleNamespace(text="See <base64>Image_0</base64>", metadata=metadata)
+        group = GroupDocsElement([], [element], DocElementTypeEnum.IMAGE)
+
+        with (
+            patch.object(group_doc_element, "asummary_image_using_llm", AsyncMock(return_value=(False, "a chart"))),
+            patch.object(group_doc_element, "summary_image_using_llm") as sync_summary,
+        ):
+            exported = await group.aexport(image_collection={"<base64>Image_0</base64>": "b64"})
+
+        assert exported.text == "See a chart"
+        assert exported.base64 == "b64"
+        sync_summary.assert_not_called()
@@ -0,0 +1,121 @@
+# Import necessary modules for testing
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("DB_PASSWORD", "test_password")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test_key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
+os.environ.setdefault("DOCLING_SERVE_URL", "http://localhost:5001")
+
+# Mock database engine creation before importing the module
+with patch("sqlalchemy.create_engine"):
+    try:
+        from src.services.rag_services.url_shortening_service import URLShorteningService
+    except ImportError as e:
+        print(f"Required dependencies not found: {e}")
+        raise
+
+
+class TestURLShorteningServiceGetOriginalUrl:
+    """Unit tests for URLShorteningService.get_original_url."""
+
+    @pytest.fixture
+    def url_shortening(self):
+        """Patch the URLShortening model used by the service."""
+        with (
+            patch("src.services.rag_services.url_shortening_service.URLShortening") as mock_model,
+            patch("src.services.rag_services.url_shortening_service.get_db_context"),
+        ):
+            mock_model.get_original_url_by_short_code.return_value = "https://x.sharepoint.com/doc"
+            yield mock_model
+
+    @pytest.fixture
+    def service(self):
+        """Create a fresh service so caches do not leak between tests."""
+        return URLShorteningService()
+
+    def test_repeated_lookups_hit_the_database_once(self, url_shortening, service):
+        """Known short codes are served from the in-process cache."""
+        for _ in range(3):
+            assert service.get_original_url("abc123") == "https://x.sharepoint.com/doc"
+
+        url_shortening.get_original_url_by_short_code.assert_called_once()
+        assert url_shortening.get_original_url_by_short_code.call_args.args == ("abc123",)
+
+    def test_unknown_short_codes_are_not_cached(self, url_shortening, service):
+        """A miss is looked up again so a later mapping is still found."""
+        url_shortening.get_original_url_by_short_code.return_value = None
+
+        assert service.get_original_url("missing") is None
+        assert service.get_original_url("missing") is None
+        assert url_shortening.get_original_url_by_short_code.call_count == 2
+        url_shortening.record_accesses.assert_not_called()
+
+    def test_accesses_are_buffered_and_flushed_in_one_batch(self, url_shortening):
+        """Access counts are written together once the flush interval has elapsed."""
+        clock = MagicMock(return_value=0.0)
+        with patch("src.services.rag_services.url_shortening_service.time.monotonic", clock):
+            service = URLShorteningService()
+            service.get_original_url("abc123")
+            service.get_original_url("abc123")
+            service.get_original_url("def456")
+            url_shortening.record_accesses.assert_not_called()
+
+            clock.return_value = service.ACCESS_FLUSH_INTERVAL_SECONDS
+            service.get_original_url("abc123")
+
+        url_shortening.record_accesses.assert_called_once()
+        (accesses,) = url_shortening.record_accesses.call_args.args
+        assert {code: count for code, (count, _) in accesses.items()} == {"abc123": 3, "def456": 1}
+
+    def test_failed_flush_does_not_fail_the_redirect(self, url_shortening, service):
+        """Access statistics are best effort."""
+        url_shortening.record_accesses.side_effect = RuntimeError("db down")
+        service.ACCESS_FLUSH_INTERVAL_SECONDS = 0
+
+        assert service.get_original_url("abc123") == "https://x.sharepoint.com/doc"
+
+    def test_flush_writes_pending_accesses_immediately(self, url_shortening, service):
+        """An explicit flush, as done on shutdown, writes whatever is buffered."""
+        service.get_original_url("abc123")
+        url_shortening.record_accesses.assert_not_called()
+
+        service.flush_access_counts()
+
+        (accesses,) = url_shortening.record_accesses.call_args.args
+        assert accesses["abc123"][0] == 1
+
+
+class TestURLShorteningServiceShortenUrl:
+    """Unit tests for URLShorteningService.shorten_url."""
+
+    def test_repeated_citations_hit_the_database_once(self):
+        """A URL that was already shortened reuses its cached short code."""
+        service = URLShorteningService()
+        with patch("src.services.rag_services.url_shortening_service.URLShortening") as url_shortening:
+            url_shortening.create_or_get_mapping.return_value = MagicMock(short_code="abc123")
+            for _ in range(3):
+                short_url, _ = service.shorten_url("https://x.sharepoint.com/doc")
+
+        assert short_url.endswith("/redirect/abc123")
+        url_shortening.create_or_get_mapping.assert_called_once()
+        assert service.get_original_url("abc123") == "https://x.sharepoint.com/doc"
+
+    def test_bulk_shortening_looks_up_only_uncached_urls_at_once(self):
+        """Cached and non-Microsoft URLs skip the database; the rest go in a single call."""
+        service = URLShorteningService()
+        with patch("src.services.rag_services.url_shortening_service.URLShortening") as url_shortening:
+            url_shortening.create_or_get_mapping.return_value = MagicMock(short_code="abc123")
+            service.shorten_url("https://x.sharepoint.com/a")
+            url_shortening.create_or_get_mappings.return_value = {"https://x.sharepoint.com/b": "def456"}
+
+            shortened = service.shorten_urls(
+                ["https://x.sharepoint.com/a", "https://x.sharepoint.com/b", "https://example.com/c"],
+            )
+
+        url_shortening.create_or_get_mappings.assert_called_once_with({"https://x.sharepoint.com/b": "x SharePoint"})
+        assert shortened["https://x.sharepoint.com/a"][0].endswith("/redirect/abc123")
+        assert shortened["https://x.sharepoint.com/b"] == (f"{service.base_domain}/redirect/def456", "x SharePoint")
+        assert shortened["https://example.com/c"][0] == "https://example.com/c"